@@ -0,0 +1,64 @@
+"""Memory benchmark: bytes held per row once a table is loaded.
+
+Usage: python benchmarks/bench_memory.py [--rows N] [--output FILE]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sql_engine import StorageEngine
+from datagen import BENCH_TABLE, populate
+
+
+def run(rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, 'bench.json')
+        with contextlib.redirect_stdout(io.StringIO()):
+            populate(StorageEngine(data_file), rows)
+
+            storage = StorageEngine(data_file)
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            storage.data[BENCH_TABLE]
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+            # Measure allocation churn of an UPDATE touching every row
+            tracemalloc.start()
+            storage.update(BENCH_TABLE, {'score': '1'})
+            _, update_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    table_bytes = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return {
+        'benchmark': 'memory',
+        'rows': rows,
+        'table_bytes': table_bytes,
+        'bytes_per_row': table_bytes / rows,
+        'update_all_peak_bytes': update_peak
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--output', help="write results as JSON to this file instead of stdout")
+    args = parser.parse_args()
+
+    text = json.dumps(run(args.rows), indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Cold-start benchmark: time to open a database and answer catalog queries.
+
+Usage: python benchmarks/bench_startup.py [--rows N] [--tables N] [--output FILE]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sql_engine import ProfessionalDatabase, StorageEngine
+from datagen import BENCH_TABLE, populate
+
+
+def build_database(data_file, tables, rows):
+    """Write a database with `tables` tables of `rows` rows each"""
+    storage = StorageEngine(data_file)
+    for t in range(tables):
+        populate(storage, rows, table_name=f"{BENCH_TABLE}_{t}")
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run(rows, tables):
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, 'bench.json')
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_database(data_file, tables, rows)
+            db, open_seconds = timed(lambda: ProfessionalDatabase(data_file))
+            _, show_seconds = timed(lambda: db.execute("SHOW TABLES"))
+            _, first_access_seconds = timed(lambda: list(db.execute(f"SELECT * FROM {BENCH_TABLE}_0 LIMIT 1").get('result', ())))
+
+    return {
+        'benchmark': 'startup',
+        'rows_per_table': rows,
+        'tables': tables,
+        'open_seconds': open_seconds,
+        'show_tables_seconds': show_seconds,
+        'first_table_access_seconds': first_access_seconds
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--tables', type=int, default=4)
+    parser.add_argument('--output', help="write results as JSON to this file instead of stdout")
+    args = parser.parse_args()
+
+    result = run(args.rows, args.tables)
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
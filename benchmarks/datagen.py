@@ -0,0 +1,44 @@
+"""Deterministic synthetic data for the benchmarks."""
+import random
+from datetime import date, timedelta
+
+BENCH_TABLE = 'bench'
+
+BENCH_SCHEMA = {'columns': {
+    'id': {'type': 'INT', 'primary_key': True},
+    'name': {'type': 'TEXT'},
+    'category': {'type': 'TEXT'},
+    'score': {'type': 'INT'},
+    'active': {'type': 'BOOLEAN'},
+    'created': {'type': 'DATE'}
+}}
+
+CATEGORIES = [f"c{i}" for i in range(10)]
+EPOCH = date(2020, 1, 1)
+
+
+def generate_rows(count, seed=42, start_id=1):
+    """Yield `count` reproducible rows matching BENCH_SCHEMA"""
+    rng = random.Random(seed)
+    for record_id in range(start_id, start_id + count):
+        yield {
+            'id': record_id,
+            'name': f"user_{rng.randrange(count)}",
+            'category': rng.choice(CATEGORIES),
+            'score': rng.randrange(100),
+            'active': rng.random() < 0.5,
+            'created': (EPOCH + timedelta(days=rng.randrange(1500))).isoformat()
+        }
+
+
+def insert_statement(row, table_name=BENCH_TABLE):
+    return (f"INSERT INTO {table_name} VALUES ({row['id']}, '{row['name']}', '{row['category']}', "
+            f"{row['score']}, {str(row['active']).upper()}, '{row['created']}')")
+
+
+def populate(storage, count, table_name=BENCH_TABLE, seed=42):
+    """Create the benchmark table and bulk load `count` rows into it"""
+    storage.create_table(table_name, BENCH_SCHEMA)
+    success, message = storage.insert_many(table_name, generate_rows(count, seed))
+    if not success:
+        raise RuntimeError(message)
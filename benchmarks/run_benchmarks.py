@@ -0,0 +1,235 @@
+"""Benchmark suite for the engine's hot paths.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--scales 1000,10000] [--repeat 3] [--output FILE]
+    python benchmarks/run_benchmarks.py --compare OLD.json NEW.json
+
+Each scale's synthetic table is bulk loaded once into a template database;
+every repetition of every case runs against a fresh copy of its files and
+times one operation through the public API. Results are written as JSON so runs can be compared across commits.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sql_engine import ProfessionalDatabase, StorageEngine
+from datagen import BENCH_TABLE, generate_rows, insert_statement, populate
+
+DEFAULT_SCALES = [1000, 10000]
+MAX_SCALE = 10000000
+
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the engine's progress output while timing"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+@contextlib.contextmanager
+def template(scale):
+    """Build the database for a scale once; yields the path of its catalog file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, 'bench.json')
+        with quiet():
+            db = ProfessionalDatabase(data_file)
+            populate(db.storage, scale)
+            db.storage.save_data()
+        yield data_file
+
+
+@contextlib.contextmanager
+def database(template_file):
+    """Open a private copy of a template database, with its table loaded as after populate"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = os.path.join(tmp, os.path.basename(template_file))
+        shutil.copy(template_file, data_file)
+        tables_dir = os.path.splitext(template_file)[0] + "_tables"
+        shutil.copytree(tables_dir, os.path.splitext(data_file)[0] + "_tables")
+        with quiet():
+            db = ProfessionalDatabase(data_file)
+            db.storage.data[BENCH_TABLE]
+        yield db
+
+
+def select(db, query):
+    """Run a SELECT and consume its rows, which are formatted lazily as they are read"""
+    result = db.execute(query)
+    return list(result.get('result', ()))
+
+
+# Each case takes a loaded database and the scale, and returns
+# (number of operations, callable that performs them).
+
+def case_single_insert(db, scale):
+    row = next(generate_rows(1, seed=7, start_id=scale + 1))
+    return 1, lambda: db.execute(insert_statement(row))
+
+
+def case_bulk_insert(db, scale, ops=200):
+    rows = list(generate_rows(ops, seed=7, start_id=scale + 1))
+    return ops, lambda: [db.execute(insert_statement(row)) for row in rows]
+
+
+def case_point_lookup(db, scale, ops=100):
+    # Rows are keyed by primary key, so these never scan
+    ids = [1 + (i * 7919) % scale for i in range(ops)]
+    return ops, lambda: [select(db, f"SELECT * FROM {BENCH_TABLE} WHERE id = {i}") for i in ids]
+
+
+def case_name_lookup(db, scale, ops=10):
+    # Equality on a non-key column: a full scan per lookup
+    names = [f"user_{(i * 7919) % scale}" for i in range(ops)]
+    return ops, lambda: [select(db, f"SELECT * FROM {BENCH_TABLE} WHERE name = '{name}'") for name in names]
+
+
+def case_name_lookup_indexed(db, scale, ops=100):
+    with quiet():
+        db.execute(f"CREATE INDEX ON {BENCH_TABLE}(name)")
+    names = [f"user_{(i * 7919) % scale}" for i in range(ops)]
+    return ops, lambda: [select(db, f"SELECT * FROM {BENCH_TABLE} WHERE name = '{name}'") for name in names]
+
+
+def case_range_scan(db, scale):
+    return 1, lambda: select(db, f"SELECT * FROM {BENCH_TABLE} WHERE score >= 90")
+
+
+def case_order_by_limit(db, scale):
+    return 1, lambda: select(db, f"SELECT * FROM {BENCH_TABLE} ORDER BY score DESC LIMIT 10")
+
+
+def case_update(db, scale):
+    return 1, lambda: db.execute(f"UPDATE {BENCH_TABLE} SET score = 1 WHERE category = c3")
+
+
+def case_delete(db, scale):
+    return 1, lambda: db.execute(f"DELETE FROM {BENCH_TABLE} WHERE score > 90")
+
+
+def case_cold_start(db, scale):
+    data_file = db.storage.data_file
+
+    def cold_start():
+        storage = StorageEngine(data_file)
+        return storage.data[BENCH_TABLE]
+    return 1, cold_start
+
+
+CASES = {
+    'single_insert': case_single_insert,
+    'bulk_insert': case_bulk_insert,
+    'point_lookup': case_point_lookup,
+    'name_lookup': case_name_lookup,
+    'name_lookup_indexed': case_name_lookup_indexed,
+    'range_scan': case_range_scan,
+    'order_by_limit': case_order_by_limit,
+    'update': case_update,
+    'delete': case_delete,
+    'cold_start': case_cold_start
+}
+
+
+def run_case(name, scale, template_file, repeat):
+    timings = []
+    for _ in range(repeat):
+        # Every repetition starts from an identical copy, since
+        # inserts, updates and deletes change the data they run against.
+        with database(template_file) as db:
+            ops, operation = CASES[name](db, scale)
+            with quiet():
+                start = time.perf_counter()
+                operation()
+                timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    return {
+        'case': name,
+        'scale': scale,
+        'ops': ops,
+        'repeat': repeat,
+        'min_seconds': best,
+        'median_seconds': statistics.median(timings),
+        'ops_per_second': ops / best if best else None
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(old_file, new_file):
+    """Print the speedup of every case present in both result files"""
+    with open(old_file) as f:
+        old = {(r['case'], r['scale']): r for r in json.load(f)['results']}
+    with open(new_file) as f:
+        new = {(r['case'], r['scale']): r for r in json.load(f)['results']}
+
+    print(f"{'case':<24}{'scale':>10}{'old (s)':>12}{'new (s)':>12}{'speedup':>10}")
+    for key in sorted(old.keys() & new.keys(), key=lambda k: (k[1], k[0])):
+        before, after = old[key]['min_seconds'], new[key]['min_seconds']
+        speedup = before / after if after else float('inf')
+        print(f"{key[0]:<24}{key[1]:>10}{before:>12.4f}{after:>12.4f}{speedup:>9.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite for the engine's hot paths")
+    parser.add_argument('--scales', default=','.join(str(s) for s in DEFAULT_SCALES),
+                        help="comma-separated row counts, up to 10,000,000")
+    parser.add_argument('--cases', default=','.join(CASES), help="comma-separated case names")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="write results as JSON to this file instead of stdout")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="compare two result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    scales = [int(scale) for scale in args.scales.split(',')]
+    cases = args.cases.split(',')
+    unknown = [name for name in cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+    if any(scale < 1 or scale > MAX_SCALE for scale in scales):
+        parser.error(f"scales must be between 1 and {MAX_SCALE}")
+
+    results = []
+    for scale in scales:
+        with template(scale) as template_file:
+            for name in cases:
+                result = run_case(name, scale, template_file, args.repeat)
+                results.append(result)
+                print(f"{name:<24}{scale:>10}{result['min_seconds']:>12.4f}s", file=sys.stderr)
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,668 @@
 # professional_database.py - COMPLETE WORKING VERSION
+import base64
+import contextlib
+import csv
+import heapq
+import io
 import json
+import lzma
+import mmap
+import pickle
 import re
 import os
-from datetime import datetime
-from tabulate import tabulate
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from itertools import accumulate, chain, islice, repeat
+from operator import attrgetter, itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+
+# Tables smaller than this are always scanned on a single core; below it the
+# cost of writing a column snapshot (after every write that bumps the table's
+# version) and dispatching workers outweighs the parallel speedup.
+PARALLEL_SCAN_MIN_ROWS = 50000
+
+# Number of hash partitions used when PARTITION BY HASH omits PARTITIONS n
+DEFAULT_HASH_PARTITIONS = 4
+
+# Default byte budget for the SELECT result cache
+DEFAULT_QUERY_CACHE_BYTES = 64 * 1024 * 1024
+
+# Block compression applied to table files; one of TableCodec.COMPRESSORS
+DEFAULT_COMPRESSION = 'zlib'
+
+# Queries slower than this are recorded in the slow query log
+DEFAULT_SLOW_QUERY_MS = 100
+SLOW_QUERY_LOG_SIZE = 50
+
+# Result rendering: output modes, rows sampled to size grid columns, and the
+# widest a grid column may grow before its cells are truncated
+OUTPUT_MODES = ['grid', 'csv', 'jsonl', 'raw']
+RENDER_SAMPLE_ROWS = 100
+MAX_COLUMN_WIDTH = 40
+
+# Rows (or index entries) sampled when estimating memory footprints
+MEMORY_SAMPLE_ROWS = 1000
+
+# Sorts over the memory limit spill runs to temp files, pickled in batches of
+# SPILL_BATCH_ROWS entries; runs are made large enough that at most
+# SPILL_MAX_RUNS files are open during the merge, even under a tiny limit
+SPILL_BATCH_ROWS = 4096
+SPILL_MAX_RUNS = 128
+
+def _value_size(value):
+    # None and booleans are shared singletons, so they cost a row nothing extra
+    if value is None or value is True or value is False:
+        return 0
+    return sys.getsizeof(value)
+
+def _sampled_size(items, count, size_of):
+    """Estimate the total size of count items from the average size of the first few"""
+    sample = list(islice(items, MEMORY_SAMPLE_ROWS))
+    if not sample:
+        return 0
+    return sum(size_of(item) for item in sample) * count // len(sample)
+
+def _estimate_size(value):
+    """Approximate bytes held by a value; containers are measured from a sample of their items"""
+    if hasattr(value, 'approximate_size'):
+        return value.approximate_size()
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + _sampled_size(iter(value.items()), len(value), lambda item: (
+            _estimate_size(item[0]) + _estimate_size(item[1])))
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + _sampled_size(iter(value), len(value), _estimate_size)
+    return _value_size(value)
+
+def _write_run(entries):
+    """Pickle an iterable of sort entries to a temp file; return the file and bytes written"""
+    f = tempfile.TemporaryFile()
+    entries = iter(entries)
+    while True:
+        batch = list(islice(entries, SPILL_BATCH_ROWS))
+        if not batch:
+            break
+        pickle.dump(batch, f, pickle.HIGHEST_PROTOCOL)
+    size = f.tell()
+    f.seek(0)
+    return f, size
+
+def _read_run(f):
+    """Yield the entries of a run written by _write_run, closing the file when done"""
+    with f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+def _scan_columns(columns, start, stop, conditions):
+    """Worker entry point: return positions in [start, stop) of a column snapshot matching conditions"""
+    names = list(columns)
+    values = [_read_snapshot_column(columns[name], start, stop) for name in names]
+    view = RowView(names)
+    matched = []
+    for i, row in enumerate(zip(*values), start):
+        view.values = row
+        if StorageEngine._evaluate_conditions(view, conditions):
+            matched.append(i)
+    return matched
+
+def _write_snapshot_column(directory, values, data_type):
+    """Write one column to a file that scan workers can map; return its layout.
+    
+    INT and DATE columns are stored as int64, FLOAT as float64 and BOOLEAN as
+    int8; anything else as UTF-8 text behind an int64 offset array. NULLs are
+    kept in a one-byte-per-row mask. Raises TypeError or OverflowError for a
+    column that does not fit its fixed-width type.
+    """
+    mask = None
+    if any(value is None for value in values):
+        mask = bytes(value is None for value in values)
+    kind = {'INT': 'q', 'DATE': 'q', 'FLOAT': 'd', 'BOOLEAN': 'b'}.get(data_type, 'text')
+    
+    if kind == 'text':
+        encoded = [b'' if value is None else str(value).encode() for value in values]
+        offsets = array('q', accumulate(map(len, encoded), initial=0))
+        parts = [offsets.tobytes(), b''.join(encoded)]
+    else:
+        parts = [array(kind, [0 if value is None else value for value in values]).tobytes()]
+    
+    layout = {'kind': kind, 'count': len(values), 'mask': None}
+    fd, layout['path'] = tempfile.mkstemp(suffix='.col', dir=directory)
+    with os.fdopen(fd, 'wb') as f:
+        for part in parts:
+            f.write(part)
+        if mask is not None:
+            layout['mask'] = f.tell()
+            f.write(mask)
+    return layout
+
+def _read_snapshot_column(layout, start, stop):
+    """Return values [start, stop) of a column written by _write_snapshot_column"""
+    kind = layout['kind']
+    with open(layout['path'], 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if kind == 'text':
+            offsets_end = 8 * (layout['count'] + 1)
+            with memoryview(mapped)[:offsets_end].cast('q') as offsets:
+                bounds = offsets[start:stop + 1].tolist()
+            data = mapped[offsets_end + bounds[0]:offsets_end + bounds[-1]]
+            base = bounds[0]
+            values = [data[low - base:high - base].decode() for low, high in zip(bounds, bounds[1:])]
+        else:
+            width = array(kind).itemsize
+            with memoryview(mapped)[:width * layout['count']].cast(kind) as column:
+                values = column[start:stop].tolist()
+            if kind == 'b':
+                values = [bool(value) for value in values]
+        
+        if layout['mask'] is not None:
+            mask = mapped[layout['mask'] + start:layout['mask'] + stop]
+            values = [None if null else value for value, null in zip(values, mask)]
+    return values
+
+class ColumnSnapshot:
+    """Columnar copy of one table version in files that parallel scan workers map read-only.
+    
+    Workers read the columns a query filters on straight from the page cache
+    instead of receiving pickled rows. Columns are written on first use; the
+    snapshot is discarded once the table's version moves on.
+    """
+    
+    def __init__(self, directory, version, rows):
+        self.directory = directory
+        self.version = version
+        self.rows = rows
+        self.columns = {}
+    
+    def column(self, row_class, column, data_type):
+        layout = self.columns.get(column)
+        if layout is None:
+            values = list(map(attrgetter(row_class._slot_of[column]), self.rows))
+            layout = self.columns[column] = _write_snapshot_column(self.directory, values, data_type)
+        return layout
+    
+    def close(self):
+        for layout in self.columns.values():
+            with contextlib.suppress(OSError):
+                os.remove(layout['path'])
+        self.columns.clear()
+
+class Row:
+    """Base class for stored rows: one slot per schema column, in column order.
+    
+    Subclasses are generated per table by make_row_class. Rows expose the
+    read side of the dict interface (get, [], keys, items) so conditions,
+    sorting and indexing work on them unchanged, without a per-row __dict__.
+    Each row also carries _seq, its position in table order, so rows found
+    through an index or partition can be returned in that order.
+    """
+    __slots__ = ()
+    _columns = ()
+    _slot_of = {}
+    _values_of = staticmethod(lambda row: ())
+    
+    def get(self, column, default=None):
+        slot = self._slot_of.get(column)
+        if slot is None:
+            return default
+        return getattr(self, slot)
+    
+    def __getitem__(self, column):
+        return getattr(self, self._slot_of[column])
+    
+    def __setitem__(self, column, value):
+        setattr(self, self._slot_of[column], value)
+    
+    def __contains__(self, column):
+        return column in self._slot_of
+    
+    def keys(self):
+        return list(self._columns)
+    
+    def values(self):
+        return list(self.as_tuple())
+    
+    def items(self):
+        return list(zip(self._columns, self.as_tuple()))
+    
+    def as_tuple(self):
+        return self._values_of(self)
+    
+    def to_dict(self):
+        return dict(zip(self._columns, self.as_tuple()))
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+def make_row_class(table_name, columns):
+    """Create a Row subclass whose slots follow the given column order"""
+    slots = tuple(f"c{i}" for i in range(len(columns)))
+    namespace = {
+        '__slots__': slots + ('_seq',),
+        '_columns': tuple(columns),
+        '_slot_of': dict(zip(columns, slots))
+    }
+    
+    # Generate __init__ the way namedtuple does, so bulk loads avoid a setattr loop
+    params = ''.join(f"{slot}=None, " for slot in slots)
+    body = ''.join(f"\n    self.{slot} = {slot}" for slot in slots)
+    exec(f"def __init__(self, {params}_seq=0):{body}\n    self._seq = _seq", {}, namespace)
+    
+    if len(slots) > 1:
+        namespace['_values_of'] = staticmethod(attrgetter(*slots))
+    elif slots:
+        namespace['_values_of'] = staticmethod(lambda row: (row.c0,))
+    row_class = type(f"{table_name.title().replace('_', '')}Row", (Row,), namespace)
+    return row_class
+
+class RowView:
+    """Row-like view over a plain value tuple, reused across tuples to avoid allocation"""
+    __slots__ = ('_positions', 'values')
+    
+    def __init__(self, columns):
+        self._positions = {column: i for i, column in enumerate(columns)}
+        self.values = ()
+    
+    def get(self, column, default=None):
+        position = self._positions.get(column)
+        if position is None:
+            return default
+        return self.values[position]
+
+class ResultRows(Sequence):
+    """Read-only sequence of SELECT result rows, formatted as dicts on access.
+    
+    Holds one value tuple per row, taken when the query ran, so later writes
+    (or a DROP TABLE) don't change a result; renderers iterate it without
+    building every dict at once.
+    """
+    __slots__ = ('columns', '_rows', '_dates')
+    
+    def __init__(self, columns, rows, dates=()):
+        self.columns = tuple(columns)
+        self._rows = rows
+        self._dates = tuple(dates)  # positions of DATE columns, stored as ordinals
+    
+    def _format(self, values):
+        record = dict(zip(self.columns, values))
+        for position in self._dates:
+            value = values[position]
+            if value is not None:
+                try:
+                    record[self.columns[position]] = date.fromordinal(value).isoformat()
+                except (ValueError, TypeError, OverflowError):
+                    # Leave an unreadable value as-is rather than failing the whole query
+                    pass
+        return record
+    
+    def __len__(self):
+        return len(self._rows)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ResultRows(self.columns, self._rows[index], self._dates)
+        return self._format(self._rows[index])
+    
+    def __iter__(self):
+        return map(self._format, self._rows)
+    
+    def __eq__(self, other):
+        if isinstance(other, (ResultRows, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"ResultRows({list(self)!r})"
+    
+    def approximate_size(self):
+        # The tuples share their values with the table's rows, so only the tuples are counted
+        return sys.getsizeof(self._rows) + _sampled_size(iter(self._rows), len(self._rows), sys.getsizeof)
+
+class QueryCache:
+    """LRU cache of SELECT results, bounded by approximate result size in bytes"""
+    
+    def __init__(self, max_bytes=DEFAULT_QUERY_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    # Quoted literals, kept verbatim when the rest of a statement is normalized
+    _QUOTED = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+    
+    @staticmethod
+    def make_key(query, params=()):
+        """Normalize whitespace and trailing semicolons so equivalent statements share an entry.
+        
+        Whitespace inside quoted literals is significant and left untouched.
+        """
+        parts = QueryCache._QUOTED.split(query.strip().rstrip(';'))
+        # split() with a capturing group puts the quoted literals at odd positions
+        normalized = ''.join(part if i % 2 else re.sub(r'\s+', ' ', part) for i, part in enumerate(parts))
+        return normalized.strip(), tuple(params)
+    
+    def get(self, key, table_version):
+        """Return the cached result for key, or None if absent or stale"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        version, result, size = entry
+        if version != table_version:
+            # The table changed since this result was cached
+            self._remove(key)
+            self.invalidations += 1
+            self.misses += 1
+            return None
+        
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return result
+    
+    def put(self, key, table_version, result):
+        size = _estimate_size(result)
+        if size > self.max_bytes:
+            return
+        
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (table_version, result, size)
+        self.current_bytes += size
+        
+        while self.current_bytes > self.max_bytes:
+            oldest = next(iter(self.entries))
+            self._remove(oldest)
+            self.evictions += 1
+    
+    def resize(self, max_bytes):
+        self.max_bytes = max_bytes
+        while self.entries and self.current_bytes > self.max_bytes:
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+    
+    def clear(self):
+        self.entries.clear()
+        self.current_bytes = 0
+    
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations
+        }
+    
+    def _remove(self, key):
+        _, _, size = self.entries.pop(key)
+        self.current_bytes -= size
+
+class QueryProfile:
+    """Timings and counters collected while executing one statement"""
+    
+    def __init__(self, query=None):
+        self.query = query
+        self.statement = query.split()[0].upper() if query else None
+        self.started_at = datetime.now()
+        self.total_seconds = 0.0
+        self.phases = {}
+        self.rows_scanned = 0
+        self.rows_returned = 0
+        self.index_hits = 0
+        self.bytes_written = 0
+        self.bytes_spilled = 0
+        self.error = None
+    
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Add the time spent inside the block to the named phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+    
+    def to_dict(self):
+        return {
+            'query': self.query,
+            'statement': self.statement,
+            'started_at': self.started_at.isoformat(),
+            'total_ms': self.total_seconds * 1000,
+            'phases_ms': {name: seconds * 1000 for name, seconds in self.phases.items()},
+            'rows_scanned': self.rows_scanned,
+            'rows_returned': self.rows_returned,
+            'index_hits': self.index_hits,
+            'bytes_written': self.bytes_written,
+            'bytes_spilled': self.bytes_spilled,
+            'error': self.error
+        }
+
+class QueryStats:
+    """Running totals over every profiled statement, plus the slow query log"""
+    
+    def __init__(self, slow_query_ms=DEFAULT_SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self.slow_queries = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+        self.hooks = []
+        self.reset()
+    
+    def reset(self):
+        self.queries = 0
+        self.errors = 0
+        self.by_statement = {}
+        self.total_seconds = 0.0
+        self.phases = {}
+        self.rows_scanned = 0
+        self.rows_returned = 0
+        self.index_hits = 0
+        self.bytes_written = 0
+        self.bytes_spilled = 0
+        self.slow_queries.clear()
+    
+    def record(self, profile):
+        self.queries += 1
+        if profile.error:
+            self.errors += 1
+        self.by_statement[profile.statement] = self.by_statement.get(profile.statement, 0) + 1
+        self.total_seconds += profile.total_seconds
+        for name, seconds in profile.phases.items():
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+        self.rows_scanned += profile.rows_scanned
+        self.rows_returned += profile.rows_returned
+        self.index_hits += profile.index_hits
+        self.bytes_written += profile.bytes_written
+        self.bytes_spilled += profile.bytes_spilled
+        
+        if profile.total_seconds * 1000 >= self.slow_query_ms:
+            self.slow_queries.append(profile.to_dict())
+        
+        for hook in list(self.hooks):
+            try:
+                hook(profile)
+            except Exception as e:
+                print(f"❌ Query hook {hook!r} failed: {e}")
+    
+    def summary(self):
+        return {
+            'queries': self.queries,
+            'errors': self.errors,
+            'by_statement': dict(self.by_statement),
+            'total_ms': self.total_seconds * 1000,
+            'avg_ms': self.total_seconds * 1000 / self.queries if self.queries else 0.0,
+            'phases_ms': {name: seconds * 1000 for name, seconds in self.phases.items()},
+            'rows_scanned': self.rows_scanned,
+            'rows_returned': self.rows_returned,
+            'index_hits': self.index_hits,
+            'bytes_written': self.bytes_written,
+            'bytes_spilled': self.bytes_spilled,
+            'slow_query_ms': self.slow_query_ms,
+            'slow_queries': list(self.slow_queries)
+        }
+
+class TableCodec:
+    """Columnar on-disk encoding for table files.
+    
+    Each column is encoded on its own: dictionary codes for repetitive values,
+    run-length encoded deltas for integer columns, packed bits for booleans,
+    and a plain list otherwise. The resulting document is serialized as compact
+    JSON and optionally compressed, behind a small header naming the codec.
+    """
+    
+    MAGIC = b'SQE1'
+    COMPRESSORS = {
+        'none': (b'n', lambda data: data, lambda data: data),
+        'zlib': (b'z', lambda data: zlib.compress(data, 6), zlib.decompress),
+        'lzma': (b'x', lzma.compress, lzma.decompress)
+    }
+    
+    @staticmethod
+    def encode_table(rows, columns, seq=False):
+        """Encode a table's rows column by column; rows are keyed by their primary key on load.
+        
+        With seq=True the rows' table-order positions are stored too, for files
+        that hold only part of a table.
+        """
+        rows = list(rows)
+        encoded_columns = {}
+        for col_name, col_info in columns.items():
+            values = [row.get(col_name) for row in rows]
+            encoded_columns[col_name] = TableCodec._encode_column(values, col_info.get('type', 'TEXT'))
+        
+        payload = {'count': len(rows), 'typed': True, 'columns': encoded_columns}
+        if seq:
+            payload['seq'] = TableCodec._encode_column([row._seq for row in rows], 'INT')
+        return payload
+    
+    @staticmethod
+    def decode_table(payload):
+        """Return the encoded column names and a list of per-row value tuples"""
+        count = payload['count']
+        names = list(payload['columns'].keys())
+        columns = [TableCodec._decode_column(encoded, count) for encoded in payload['columns'].values()]
+        rows = list(zip(*columns)) if columns else [() for _ in range(count)]
+        return names, rows
+    
+    @staticmethod
+    def decode_seq(payload):
+        """Return the stored table-order positions of the rows, or None if the file has none"""
+        if 'seq' not in payload:
+            return None
+        return TableCodec._decode_column(payload['seq'], payload['count'])
+    
+    @staticmethod
+    def pack(payload, compression=DEFAULT_COMPRESSION):
+        tag, compress, _ = TableCodec.COMPRESSORS[compression]
+        data = json.dumps(payload, separators=(',', ':')).encode()
+        return TableCodec.MAGIC + tag + compress(data)
+    
+    @staticmethod
+    def unpack(blob):
+        if not blob.startswith(TableCodec.MAGIC):
+            raise ValueError("Not an encoded table file")
+        tag = blob[len(TableCodec.MAGIC):len(TableCodec.MAGIC) + 1]
+        for codec_tag, _, decompress in TableCodec.COMPRESSORS.values():
+            if codec_tag == tag:
+                return json.loads(decompress(blob[len(TableCodec.MAGIC) + 1:]))
+        raise ValueError(f"Unknown table compression {tag!r}")
+    
+    @staticmethod
+    def _encode_column(values, data_type):
+        if data_type == 'BOOLEAN' and all(type(value) is bool for value in values):
+            packed = bytearray((len(values) + 7) // 8)
+            for i, value in enumerate(values):
+                if value:
+                    packed[i >> 3] |= 1 << (i & 7)
+            return {'enc': 'bits', 'data': base64.b64encode(bytes(packed)).decode('ascii')}
+        
+        if data_type in ['INT', 'DATE'] and values and all(type(value) is int for value in values):
+            deltas = [values[0]] + [b - a for a, b in zip(values, values[1:])]
+            return {'enc': 'delta_rle', 'runs': TableCodec._run_lengths(deltas)}
+        
+        distinct = {}
+        try:
+            codes = [distinct.setdefault(value, len(distinct)) for value in values]
+        except TypeError:
+            return {'enc': 'plain', 'values': values}
+        if len(distinct) * 2 <= len(values):
+            return {'enc': 'dict', 'values': list(distinct), 'codes': TableCodec._run_lengths(codes)}
+        return {'enc': 'plain', 'values': values}
+    
+    @staticmethod
+    def _decode_column(encoded, count):
+        encoding = encoded['enc']
+        if encoding == 'plain':
+            return encoded['values']
+        if encoding == 'dict':
+            dictionary = encoded['values']
+            return [dictionary[code] for code in TableCodec._expand_runs(encoded['codes'])]
+        if encoding == 'delta_rle':
+            return list(accumulate(TableCodec._expand_runs(encoded['runs'])))
+        if encoding == 'bits':
+            packed = base64.b64decode(encoded['data'])
+            return [bool(packed[i >> 3] & (1 << (i & 7))) for i in range(count)]
+        raise ValueError(f"Unknown column encoding '{encoding}'")
+    
+    @staticmethod
+    def _run_lengths(values):
+        """Collapse values into [value, count] runs"""
+        runs = []
+        for value in values:
+            if runs and runs[-1][0] == value:
+                runs[-1][1] += 1
+            else:
+                runs.append([value, 1])
+        return runs
+    
+    @staticmethod
+    def _expand_runs(runs):
+        expanded = []
+        for value, count in runs:
+            expanded.extend(repeat(value, count))
+        return expanded
 
 class SQLParser:
     @staticmethod
     def parse_create_table(query):
         """Parse CREATE TABLE statement"""
         try:
+            # Split off an optional PARTITION BY clause before parsing columns
+            partition = None
+            partition_match = re.search(
+                r'\)\s*PARTITION BY\s+(HASH|RANGE)\s*\(\s*(\w+)\s*\)(?:\s+(PARTITIONS|INTERVAL)\s+(\d+))?\s*$',
+                query, re.IGNORECASE)
+            if partition_match:
+                partition_type = partition_match.group(1).upper()
+                partition = {'type': partition_type, 'column': partition_match.group(2)}
+                option = (partition_match.group(3) or '').upper()
+                size = int(partition_match.group(4)) if partition_match.group(4) else None
+                
+                if partition_type == 'HASH':
+                    if option == 'INTERVAL':
+                        return None, "HASH partitioning uses PARTITIONS n, not INTERVAL"
+                    partition['partitions'] = size or DEFAULT_HASH_PARTITIONS
+                else:
+                    if option != 'INTERVAL' or not size:
+                        return None, "RANGE partitioning requires INTERVAL n"
+                    partition['interval'] = size
+                query = query[:partition_match.start() + 1]
+            
             # Extract table name and column definitions
             table_match = re.search(r'CREATE TABLE\s+(\w+)\s*\((.*)\)', query, re.IGNORECASE | re.DOTALL)
             if not table_match:
@@ -43,8 +696,10 @@ class SQLParser:
                         column_info['type'] = 'FLOAT'
                     elif part_upper in ['BOOLEAN', 'BOOL']:
                         column_info['type'] = 'BOOLEAN'
-                    elif part_upper in ['DATE', 'DATETIME']:
+                    elif part_upper == 'DATE':
                         column_info['type'] = 'DATE'
+                    elif part_upper == 'DATETIME':
+                        column_info['type'] = 'DATETIME'
                     elif part_upper == 'PRIMARY' and i+1 < len(col_parts) and col_parts[i+1].upper() == 'KEY':
                         column_info['primary_key'] = True
                     elif part_upper == 'NOT' and i+1 < len(col_parts) and col_parts[i+1].upper() == 'NULL':
@@ -57,6 +712,12 @@ class SQLParser:
                 columns[column_name] = column_info
             
             schema = {'columns': columns}
+            if partition:
+                if partition['column'] not in columns:
+                    return None, f"Partition column '{partition['column']}' is not defined"
+                if partition['type'] == 'RANGE' and columns[partition['column']]['type'] not in ['INT', 'FLOAT', 'DATE']:
+                    return None, "RANGE partitioning requires an INT, FLOAT or DATE column"
+                schema['partition'] = partition
             return table_name, schema
             
         except Exception as e:
@@ -129,7 +790,8 @@ class SQLParser:
             
             # Parse WHERE conditions
             conditions = []
-            where_match = re.search(r'WHERE\s+(.+)', query, re.IGNORECASE)
+            where_match = re.search(r'WHERE\s+(.+?)(?=\s+ORDER BY\s|\s+LIMIT\s|\s*;?\s*$)', query,
+                                    re.IGNORECASE | re.DOTALL)
             if where_match:
                 where_clause = where_match.group(1)
                 # Simple condition parsing (column operator value)
@@ -168,6 +830,20 @@ class SQLParser:
         except Exception as e:
             return None, f"Parse error: {str(e)}"
     
+    @staticmethod
+    def parse_create_view(query):
+        """Parse CREATE MATERIALIZED VIEW statement"""
+        view_match = re.search(r'CREATE MATERIALIZED VIEW\s+(\w+)\s+AS\s+(SELECT\s.+)', query,
+                               re.IGNORECASE | re.DOTALL)
+        if not view_match:
+            return None, "Invalid CREATE MATERIALIZED VIEW syntax. Use: CREATE MATERIALIZED VIEW name AS SELECT ..."
+        
+        select_query = view_match.group(2).strip().rstrip(';')
+        result = SQLParser.parse_select(select_query)
+        if not result or not result[0]:
+            return None, result[1] if result else "Invalid SELECT syntax"
+        return view_match.group(1), select_query
+    
     @staticmethod
     def parse_update(query):
         """Parse UPDATE statement"""
@@ -235,84 +911,441 @@ class SQLParser:
         except Exception as e:
             return None, f"Parse error: {str(e)}"
 
+class TableStore(dict):
+    """Table name -> records mapping that loads each table on first access"""
+    
+    def __init__(self, loader):
+        super().__init__()
+        self._loader = loader
+    
+    def __missing__(self, table_name):
+        return self._loader(table_name)
+
 class StorageEngine:
     def __init__(self, data_file="sql_engine.json"):
         self.data_file = data_file
-        self.data = {}
+        self.tables_dir = os.path.splitext(data_file)[0] + "_tables"
+        self.compression = DEFAULT_COMPRESSION
+        self.data = TableStore(self._load_table)
         self.schemas = {}
+        self.catalog = {}
         self.indexes = {}
+        self.partitions = {}
+        self.views = {}
+        self.view_rows = {}
+        self.row_classes = {}
+        self.table_versions = {}
+        self.next_seq = {}
+        self.parallelism = 1
+        self.memory_limit = None
+        self._pool = None
+        self._snapshots = {}
+        self._snapshot_dir = None
+        self._dirty = set()
+        self._dirty_partitions = {}
+        self.profile = QueryProfile()
         self.load_data()
     
     def load_data(self):
-        """Load database from file"""
+        """Load the catalog from file; table data is loaded on first access"""
+        self.data = TableStore(self._load_table)
+        self.schemas = {}
+        self.catalog = {}
+        self.indexes = {}
+        self.partitions = {}
+        self.views = {}
+        self.view_rows = {}
+        self._dirty = set()
+        self._dirty_partitions = {}
         try:
             if os.path.exists(self.data_file):
                 with open(self.data_file, 'r') as f:
                     saved_data = json.load(f)
-                    self.data = saved_data.get('tables', {})
-                    self.schemas = saved_data.get('schemas', {})
-                    self.indexes = saved_data.get('indexes', {})
-                print(f"✓ Database loaded with {len(self.data)} tables")
-            else:
-                self.data = {}
-                self.schemas = {}
-                self.indexes = {}
-                print("✓ New database created")
+                self.schemas = saved_data.get('schemas', {})
+                self.catalog = saved_data.get('catalog', {})
+                self.compression = saved_data.get('settings', {}).get('compression', DEFAULT_COMPRESSION)
+                self.views = saved_data.get('views', {})
+                
+                # Older databases keep every table inline in the catalog file;
+                # load them now and move them to per-table files on next save.
+                legacy_indexes = saved_data.get('indexes', {})
+                for table_name, records in saved_data.get('tables', {}).items():
+                    self.catalog[table_name] = {
+                        'record_count': len(records),
+                        'indexes': list(legacy_indexes.get(table_name, {}).keys())
+                    }
+                    self._install_table(table_name, self._rows_from_records(table_name, records.values()))
         except Exception as e:
             print(f"❌ Error loading database: {e}")
-            self.data = {}
             self.schemas = {}
-            self.indexes = {}
+            self.catalog = {}
     
     def save_data(self):
-        """Save database to file"""
+        """Save the catalog and every table modified since the last save"""
+        with self.profile.phase('persist'):
+            self._save_data()
+    
+    def _save_data(self):
         try:
+            for table_name in self._dirty:
+                if table_name not in self.data:
+                    continue
+                if 'partition' in self.schemas.get(table_name, {}):
+                    self._write_partitions(table_name, self._dirty_partitions.get(table_name))
+                else:
+                    self._write_table(table_name)
+            self._dirty.clear()
+            self._dirty_partitions.clear()
+            
+            catalog = {}
+            for table_name in self.schemas:
+                if table_name in self.data:
+                    catalog[table_name] = {
+                        'record_count': len(self.data[table_name]),
+                        'indexes': list(self.indexes.get(table_name, {}).keys())
+                    }
+                    if 'partition' in self.schemas[table_name]:
+                        # Partition keys and sizes, so partitions can be found and
+                        # dropped without loading the table
+                        catalog[table_name]['partitions'] = [
+                            [key, len(record_ids)] for key, record_ids in self.partitions[table_name].items()]
+                else:
+                    catalog[table_name] = self.catalog.get(table_name, {'record_count': 0, 'indexes': []})
+            self.catalog = catalog
+            
             data_to_save = {
-                'tables': self.data,
                 'schemas': self.schemas,
-                'indexes': self.indexes,
+                'catalog': self.catalog,
+                'views': {name: {key: value for key, value in view.items() if not key.startswith('_')}
+                          for name, view in self.views.items()},
+                'settings': {'compression': self.compression},
                 'metadata': {
                     'last_updated': datetime.now().isoformat(),
-                    'total_tables': len(self.data)
+                    'total_tables': len(self.schemas)
                 }
             }
             with open(self.data_file, 'w') as f:
                 json.dump(data_to_save, f, indent=2)
+                self.profile.bytes_written += f.tell()
         except Exception as e:
             print(f"❌ Error saving database: {e}")
     
+    def is_loaded(self, table_name):
+        """Check whether a table's records are already in memory"""
+        return table_name in self.data
+    
+    def set_compression(self, compression):
+        """Choose the block compression used when table files are next written"""
+        if compression not in TableCodec.COMPRESSORS:
+            return False, f"Unknown compression '{compression}'. Use one of: {', '.join(TableCodec.COMPRESSORS)}"
+        
+        self.compression = compression
+        self.save_data()
+        return True, f"Table files will be written with {compression} compression"
+    
+    def set_memory_limit(self, limit_bytes):
+        """Cap a query's working set; sorts larger than this spill to temp files. 0 removes the cap"""
+        if limit_bytes < 0:
+            return False, "Memory limit cannot be negative"
+        
+        self.memory_limit = limit_bytes or None
+        if self.memory_limit is None:
+            return True, "Memory limit removed"
+        return True, f"Memory limit set to {limit_bytes} bytes"
+    
+    # Memory Accounting
+    def table_memory(self, table_name):
+        """Estimate the bytes held by a loaded table, its indexes and partition map, or None if unloaded.
+        
+        Sizes are extrapolated from a sample of MEMORY_SAMPLE_ROWS rows or
+        entries. Record ids shared between the table and its indexes are
+        counted once, with the table.
+        """
+        if not self.is_loaded(table_name):
+            return None
+        
+        table = self.data[table_name]
+        rows = sys.getsizeof(table) + _sampled_size(iter(table.items()), len(table), lambda item: (
+            _value_size(item[0]) + sys.getsizeof(item[1]) + sum(map(_value_size, item[1].as_tuple()))))
+        indexes = {column: self._id_map_size(index) for column, index in self.indexes.get(table_name, {}).items()}
+        partitions = 0
+        if 'partition' in self.schemas.get(table_name, {}):
+            partitions = self._id_map_size(self.partitions.get(table_name, {}))
+        return {
+            'rows': rows,
+            'indexes': indexes,
+            'partitions': partitions,
+            'total': rows + sum(indexes.values()) + partitions
+        }
+    
+    def memory_usage(self):
+        """Estimate the bytes held by every table (None if unloaded) and materialized view"""
+        return {
+            'tables': {table_name: self.table_memory(table_name) for table_name in self.get_all_tables()},
+            'views': {view_name: sys.getsizeof(record_ids) for view_name, record_ids in self.view_rows.items()}
+        }
+    
+    @staticmethod
+    def _id_map_size(id_map):
+        # Index and partition maps are {value: set(record ids)}
+        return sys.getsizeof(id_map) + _sampled_size(iter(id_map.items()), len(id_map), lambda item: (
+            _value_size(item[0]) + sys.getsizeof(item[1])))
+    
+    def _table_path(self, table_name):
+        return os.path.join(self.tables_dir, f"{table_name}.tbl")
+    
+    def _legacy_table_path(self, table_name):
+        return os.path.join(self.tables_dir, f"{table_name}.json")
+    
+    def _partition_path(self, table_name, key):
+        return os.path.join(self.tables_dir, f"{table_name}.{'null' if key is None else key}.tbl")
+    
+    def _load_table(self, table_name):
+        """Read one table's records from its file(s) and rebuild derived structures"""
+        if table_name not in self.schemas:
+            raise KeyError(table_name)
+        
+        partition_sizes = self.catalog.get(table_name, {}).get('partitions')
+        if 'partition' in self.schemas[table_name] and partition_sizes is not None:
+            return self._load_partitions(table_name, [key for key, _ in partition_sizes])
+        
+        path = self._table_path(table_name)
+        legacy_path = self._legacy_table_path(table_name)
+        records = {}
+        if os.path.exists(path):
+            records = self._read_rows(table_name, path)
+        elif os.path.exists(legacy_path):
+            with open(legacy_path, 'r') as f:
+                records = self._rows_from_records(table_name, json.load(f).get('records', {}).values())
+        return self._install_table(table_name, records)
+    
+    def _load_partitions(self, table_name, keys):
+        """Read a partitioned table from one file per partition; the files give the partition map directly.
+        
+        Each file stores its rows' table-order positions in order, so merging
+        the files restores the table's row order.
+        """
+        loaded = []
+        partitions = {}
+        ordered = True
+        for key in keys:
+            path = self._partition_path(table_name, key)
+            if not os.path.exists(path):
+                continue
+            rows, has_seq = self._read_rows(table_name, path, with_seq=True)
+            loaded.append(rows)
+            partitions[key] = set(rows)
+            ordered = ordered and has_seq
+        
+        if ordered:
+            records = dict(heapq.merge(*(rows.items() for rows in loaded), key=lambda item: item[1]._seq))
+        else:
+            # Written by an older version without positions; store them on the next save
+            records = {record_id: row for rows in loaded for record_id, row in rows.items()}
+            self._dirty.add(table_name)
+            self._dirty_partitions[table_name] = None
+        return self._install_table(table_name, records, partitions, keep_seq=ordered)
+    
+    def _read_rows(self, table_name, path, with_seq=False):
+        """Read rows keyed by primary key from a table file; with_seq also returns whether positions were stored"""
+        with open(path, 'rb') as f:
+            payload = TableCodec.unpack(f.read())
+        names, value_rows = TableCodec.decode_table(payload)
+        row_class = self._row_class(table_name)
+        if payload.get('typed') and tuple(names) == row_class._columns:
+            pk_position = names.index(self._primary_key_column(table_name))
+            rows = {values[pk_position]: row_class(*values) for values in value_rows}
+        else:
+            rows = self._rows_from_records(table_name, (dict(zip(names, values)) for values in value_rows))
+        
+        seqs = TableCodec.decode_seq(payload)
+        if seqs is not None:
+            for row, seq in zip(rows.values(), seqs):
+                row._seq = seq
+        return (rows, seqs is not None) if with_seq else rows
+    
+    def _rows_from_records(self, table_name, records):
+        """Convert record dicts written by older versions into rows keyed by primary key.
+        
+        Values are coerced to their native types. Older versions did not validate
+        every type, so a column whose stored values don't fit its declared type is
+        retyped (DATE holding timestamps becomes DATETIME, anything else TEXT)
+        rather than losing data. The table is scheduled to be rewritten in the
+        current format.
+        """
+        records = list(records)
+        columns = self.schemas.get(table_name, {}).get('columns', {})
+        for col_name, col_info in columns.items():
+            invalid = [record[col_name] for record in records if col_name in record
+                       and not self._coerce_value(record[col_name], col_info, col_name, stored=True)[0]]
+            if invalid:
+                self._retype_column(table_name, col_name, invalid)
+        
+        pk_column = self._primary_key_column(table_name)
+        row_class = self._row_class(table_name)
+        rows = {}
+        for record in records:
+            coerced = {}
+            for col_name, value in record.items():
+                if col_name in columns:
+                    coerced[col_name] = self._coerce_value(value, columns[col_name], col_name, stored=True)[1]
+            rows[coerced.get(pk_column)] = self._make_row(row_class, coerced)
+        self._dirty.add(table_name)
+        return rows
+    
+    def _retype_column(self, table_name, col_name, invalid):
+        """Widen a column so that every stored value in it, including `invalid`, keeps its text"""
+        schema = self.schemas[table_name]
+        col_info = schema['columns'][col_name]
+        old_type = col_info.get('type', 'TEXT')
+        partition = schema.get('partition')
+        if partition and partition['column'] == col_name:
+            raise ValueError(f"{table_name}.{col_name} holds values that are not valid {old_type} "
+                             f"(e.g. {invalid[0]!r}); the table was left unchanged on disk")
+        
+        new_type = 'TEXT'
+        if old_type == 'DATE' and all(self._coerce_value(value, {'type': 'DATETIME'}, col_name)[0]
+                                      for value in invalid):
+            new_type = 'DATETIME'
+        col_info['type'] = new_type
+        print(f"⚠️  {table_name}.{col_name}: {len(invalid)} stored value(s) are not valid {old_type} "
+              f"(e.g. {invalid[0]!r}); column retyped to {new_type}")
+    
+    def _row_class(self, table_name):
+        row_class = self.row_classes.get(table_name)
+        if row_class is None:
+            columns = list(self.schemas.get(table_name, {}).get('columns', {}).keys())
+            row_class = self.row_classes[table_name] = make_row_class(table_name, columns)
+        return row_class
+    
+    @staticmethod
+    def _make_row(row_class, record):
+        return row_class(*[record.get(column) for column in row_class._columns])
+    
+    def _install_table(self, table_name, records, partitions=None, keep_seq=False):
+        dict.__setitem__(self.data, table_name, records)
+        # Rows from partition files keep their stored positions, which other
+        # partition files still refer to; anything else is numbered in order
+        if not keep_seq:
+            for seq, row in enumerate(records.values()):
+                row._seq = seq
+        self.next_seq[table_name] = next(reversed(records.values()))._seq + 1 if records else 0
+        
+        # Indexes are derived data, rebuilt from the records
+        index_columns = self.catalog.get(table_name, {}).get('indexes', [])
+        self.indexes[table_name] = {column: self._build_index(table_name, column) for column in index_columns}
+        if partitions is not None:
+            self.partitions[table_name] = partitions
+        elif 'partition' in self.schemas.get(table_name, {}):
+            # Stored as a single file by an older version; split it into
+            # partition files on the next save
+            self._rebuild_partitions(table_name)
+            self._dirty.add(table_name)
+            self._dirty_partitions[table_name] = None
+        return records
+    
+    def _write_table(self, table_name):
+        columns = self.schemas[table_name].get('columns', {})
+        payload = TableCodec.encode_table(self.data[table_name].values(), columns)
+        
+        os.makedirs(self.tables_dir, exist_ok=True)
+        with open(self._table_path(table_name), 'wb') as f:
+            self.profile.bytes_written += f.write(TableCodec.pack(payload, self.compression))
+        
+        legacy_path = self._legacy_table_path(table_name)
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
+    
+    def _write_partitions(self, table_name, keys=None):
+        """Write the given partitions of a table (all when keys is None), one file each"""
+        columns = self.schemas[table_name].get('columns', {})
+        table = self.data[table_name]
+        partitions = self.partitions[table_name]
+        if keys is None:
+            # Clears the single-file layout and any stale partition files too
+            self._remove_table_file(table_name)
+            keys = list(partitions)
+        
+        os.makedirs(self.tables_dir, exist_ok=True)
+        for key in keys:
+            path = self._partition_path(table_name, key)
+            record_ids = partitions.get(key)
+            if not record_ids:
+                if os.path.exists(path):
+                    os.remove(path)
+                continue
+            rows = sorted((table[record_id] for record_id in record_ids), key=attrgetter('_seq'))
+            payload = TableCodec.encode_table(rows, columns, seq=True)
+            with open(path, 'wb') as f:
+                self.profile.bytes_written += f.write(TableCodec.pack(payload, self.compression))
+    
+    def _remove_table_file(self, table_name):
+        """Remove a table's file, its legacy file and any partition files"""
+        for path in [self._table_path(table_name), self._legacy_table_path(table_name)]:
+            if os.path.exists(path):
+                os.remove(path)
+        if os.path.isdir(self.tables_dir):
+            prefix = f"{table_name}."
+            for file_name in os.listdir(self.tables_dir):
+                if file_name.startswith(prefix) and file_name.endswith('.tbl'):
+                    os.remove(os.path.join(self.tables_dir, file_name))
+    
     # Enhanced Table Operations with Duplicate Protection
     def table_exists(self, table_name):
         """Check if table already exists"""
-        return table_name in self.data
+        return table_name in self.schemas
     
     def get_all_tables(self):
         """Get list of all existing tables"""
-        return list(self.data.keys())
+        return list(self.schemas.keys())
     
-    def get_table_info(self, table_name):
-        """Get detailed information about a table"""
+    def get_table_info(self, table_name, include_memory=False):
+        """Get detailed information about a table; memory estimates are sampled, so only on request"""
         if not self.table_exists(table_name):
             return None
         
         schema = self.schemas.get(table_name, {})
-        record_count = len(self.data.get(table_name, {}))
         columns = schema.get('columns', {})
         
+        # Answer from the catalog rather than loading an unloaded table
+        if self.is_loaded(table_name):
+            record_count = len(self.data[table_name])
+            index_columns = list(self.indexes.get(table_name, {}).keys())
+        else:
+            entry = self.catalog.get(table_name, {})
+            record_count = entry.get('record_count', 0)
+            index_columns = entry.get('indexes', [])
+        
+        if self.is_loaded(table_name):
+            partitions = {key: len(ids) for key, ids in self.partitions.get(table_name, {}).items()}
+        else:
+            partitions = dict((key, size) for key, size in self.catalog.get(table_name, {}).get('partitions', []))
+        partitions = dict(sorted(partitions.items(), key=lambda item: str(item[0])))
+        
         return {
             'name': table_name,
             'columns': columns,
             'record_count': record_count,
-            'indexes': list(self.indexes.get(table_name, {}).keys())
+            'indexes': index_columns,
+            'partition': schema.get('partition'),
+            'partitions': partitions,
+            'memory': self.table_memory(table_name) if include_memory else None
         }
     
     def create_table(self, table_name, schema):
         """Create table only if it doesn't exist - WITH DUPLICATE PROTECTION"""
         if self.table_exists(table_name):
             return False, f"Table '{table_name}' already exists! Use a different name or DROP TABLE first."
+        if table_name in self.views:
+            return False, f"'{table_name}' is already a materialized view"
         
-        self.data[table_name] = {}
         self.schemas[table_name] = schema
+        self.catalog[table_name] = {'record_count': 0, 'indexes': []}
+        self.data[table_name] = {}
+        self.indexes[table_name] = {}
+        if 'partition' in schema:
+            self.partitions[table_name] = {}
+        self._bump_version(table_name)
         self.save_data()
         print(f"✓ Table '{table_name}' created successfully")
         return True, f"Table '{table_name}' created successfully"
@@ -323,15 +1356,32 @@ class StorageEngine:
             return False, f"Table '{table_name}' does not exist"
         
         # Confirm deletion for safety
-        record_count = len(self.data[table_name])
-        del self.data[table_name]
+        record_count = self.get_table_info(table_name)['record_count']
+        self.data.pop(table_name, None)
+        self.catalog.pop(table_name, None)
+        self._remove_table_file(table_name)
         if table_name in self.schemas:
             del self.schemas[table_name]
+        self.row_classes.pop(table_name, None)
+        self.next_seq.pop(table_name, None)
+        dependent_views = [name for name, view in self.views.items() if view['table'] == table_name]
+        for view_name in dependent_views:
+            del self.views[view_name]
+            self.view_rows.pop(view_name, None)
+            self._bump_version(view_name)
         if table_name in self.indexes:
             del self.indexes[table_name]
+        if table_name in self.partitions:
+            del self.partitions[table_name]
+        self._dirty_partitions.pop(table_name, None)
+        self._drop_snapshot(table_name)
+        self._bump_version(table_name)
         
         self.save_data()
-        return True, f"Table '{table_name}' dropped successfully ({record_count} records deleted)"
+        message = f"Table '{table_name}' dropped successfully ({record_count} records deleted)"
+        if dependent_views:
+            message += f"; dropped dependent views: {', '.join(dependent_views)}"
+        return True, message
     
     def rename_table(self, old_name, new_name):
         """Rename an existing table"""
@@ -342,11 +1392,28 @@ class StorageEngine:
             return False, f"Table '{new_name}' already exists"
         
         # Rename the table
+        self.data[old_name]  # make sure the records are in memory
         self.data[new_name] = self.data.pop(old_name)
+        self.catalog[new_name] = self.catalog.pop(old_name, {})
+        self._remove_table_file(old_name)
         if old_name in self.schemas:
             self.schemas[new_name] = self.schemas.pop(old_name)
+        if old_name in self.row_classes:
+            self.row_classes[new_name] = self.row_classes.pop(old_name)
+        if old_name in self.next_seq:
+            self.next_seq[new_name] = self.next_seq.pop(old_name)
+        for view in self.views.values():
+            if view['table'] == old_name:
+                view['table'] = new_name
         if old_name in self.indexes:
             self.indexes[new_name] = self.indexes.pop(old_name)
+        if old_name in self.partitions:
+            self.partitions[new_name] = self.partitions.pop(old_name)
+        self._dirty_partitions.pop(old_name, None)
+        self._dirty_partitions[new_name] = None
+        self._drop_snapshot(old_name)
+        self._bump_version(old_name)
+        self._bump_version(new_name)
         
         self.save_data()
         return True, f"Table '{old_name}' renamed to '{new_name}'"
@@ -356,21 +1423,44 @@ class StorageEngine:
         if not self.table_exists(table_name):
             return False, f"Table '{table_name}' does not exist. Create it first using CREATE TABLE."
         
+        success, message = self._insert_record(table_name, record_data)
+        if not success:
+            return success, message
+        
+        self.save_data()
+        return True, f"Record inserted into '{table_name}'"
+    
+    def insert_many(self, table_name, records):
+        """Insert a batch of records, saving once at the end instead of per record"""
+        if not self.table_exists(table_name):
+            return False, f"Table '{table_name}' does not exist. Create it first using CREATE TABLE."
+        
+        inserted_count = 0
+        for record_data in records:
+            success, message = self._insert_record(table_name, record_data)
+            if not success:
+                if inserted_count > 0:
+                    self.save_data()
+                return False, f"{message} (after {inserted_count} records inserted)"
+            inserted_count += 1
+        
+        if inserted_count > 0:
+            self.save_data()
+        return True, f"Inserted {inserted_count} records into '{table_name}'"
+    
+    def _insert_record(self, table_name, record_data):
         schema = self.schemas.get(table_name, {})
         columns = schema.get('columns', {})
         
         # Validate against schema
-        validation_result = self._validate_record(record_data, columns, table_name)
-        if not validation_result[0]:
-            return validation_result
+        with self.profile.phase('validate'):
+            success, result = self._coerce_record(record_data, columns, table_name)
+        if not success:
+            return False, result
+        record_data = result
         
         # Get primary key
-        pk_column = None
-        for col_name, col_info in columns.items():
-            if col_info.get('primary_key'):
-                pk_column = col_name
-                break
-        
+        pk_column = self._primary_key_column(table_name)
         if not pk_column:
             return False, "No primary key defined in table schema"
         
@@ -379,105 +1469,598 @@ class StorageEngine:
             return False, f"Primary key '{pk_column}' is required"
         
         # Check for duplicate primary key
-        if str(record_id) in self.data[table_name]:
+        if record_id in self.data[table_name]:
             return False, f"Duplicate primary key '{record_id}' - record already exists"
         
-        # Store record
-        self.data[table_name][str(record_id)] = record_data
-        
-        # Update indexes
-        self._update_indexes(table_name, record_id, record_data)
-        
-        self.save_data()
-        return True, f"Record inserted into '{table_name}'"
+        # Store record as a compact row keyed by its native primary key
+        row = self._make_row(self._row_class(table_name), record_data)
+        row._seq = self._take_seq(table_name)
+        self.data[table_name][record_id] = row
+        
+        # Update indexes and partition membership
+        self._update_indexes(table_name, record_id, row)
+        self._assign_partition(table_name, record_id, row)
+        self._apply_view_delta(table_name, record_id, row)
+        self._bump_version(table_name)
+        return True, "Record inserted"
     
     def select(self, table_name, conditions=None, order_by=None, limit=None):
         if not self.table_exists(table_name):
             return None, f"Table '{table_name}' does not exist"
         
-        records = self.data[table_name]
-        
-        # Apply WHERE conditions
-        if conditions:
-            filtered_records = {}
-            for record_id, record in records.items():
-                if self._evaluate_conditions(record, conditions):
-                    filtered_records[record_id] = record
-            records = filtered_records
+        success, conditions = self._coerce_conditions(table_name, conditions)
+        if not success:
+            return None, conditions
         
-        # Convert to list for sorting
-        records_list = list(records.values())
+        with self.profile.phase('scan'):
+            records = self._candidate_records(table_name, conditions)
+            self.profile.rows_scanned += len(records)
+            
+            # Apply WHERE conditions; parallel scans cover whole tables, not index or partition subsets
+            records_list = None
+            if (conditions and self.parallelism > 1 and len(records) >= PARALLEL_SCAN_MIN_ROWS
+                    and records is self.data[table_name]):
+                records_list = self._parallel_scan(table_name, conditions)
+            if records_list is None and conditions:
+                records_list = [record for record in records.values()
+                                if self._evaluate_conditions(record, conditions)]
+            elif records_list is None:
+                records_list = list(records.values())
         
         # Apply ORDER BY
         if order_by:
-            column, direction = order_by
-            reverse = (direction.upper() == 'DESC')
-            records_list.sort(key=lambda x: x.get(column, ''), reverse=reverse)
+            records_list = self._sort_records(table_name, records_list, order_by, limit)
         
         # Apply LIMIT
         if limit and limit > 0:
             records_list = records_list[:limit]
         
+        self.profile.rows_returned += len(records_list)
         return records_list, f"Found {len(records_list)} records in '{table_name}'"
     
     def update(self, table_name, updates, conditions=None):
+        """Apply one SET list to every matching row as a single batch"""
         if not self.table_exists(table_name):
             return False, f"Table '{table_name}' does not exist"
         
-        updated_count = 0
+        success, conditions = self._coerce_conditions(table_name, conditions)
+        if not success:
+            return False, conditions
+        
         schema = self.schemas.get(table_name, {})
         columns = schema.get('columns', {})
+        pk_column = self._primary_key_column(table_name)
+        table = self.data[table_name]
         
-        for record_id, record in self.data[table_name].items():
-            # Check conditions
-            if conditions and not self._evaluate_conditions(record, conditions):
-                continue
-            
-            # Create updated record
-            updated_record = record.copy()
+        # SET values are the same for every row, so validate them once up front
+        changes = {}
+        with self.profile.phase('validate'):
             for column, new_value in updates.items():
-                if column in record:
-                    # Validate new value
-                    col_info = columns.get(column, {})
-                    validation = self._validate_value(new_value, col_info, column)
-                    if not validation[0]:
-                        return False, f"Validation failed for {column}: {validation[1]}"
-                    updated_record[column] = new_value
-            
-            # Replace record
-            self.data[table_name][record_id] = updated_record
-            updated_count += 1
-            
-            # Update indexes
-            self._update_indexes(table_name, record_id, updated_record)
-        
-        if updated_count > 0:
-            self.save_data()
-            return True, f"Updated {updated_count} records in '{table_name}'"
-        else:
+                if column not in columns:
+                    continue
+                success, result = self._coerce_value(new_value, columns[column], column)
+                if not success:
+                    return False, f"Validation failed for {column}: {result}"
+                changes[column] = result
+        
+        matches = self._find_matches(table_name, conditions)
+        if not matches:
             return True, f"No records matched the conditions in '{table_name}'"
+        
+        # Check primary key changes before touching any row, so a failed UPDATE changes nothing
+        new_id = changes.get(pk_column)
+        rekey = pk_column in changes and any(record_id != new_id for record_id, _ in matches)
+        if rekey and (len(matches) > 1 or new_id in table):
+            return False, f"Duplicate primary key '{new_id}' - record already exists"
+        
+        with self.profile.phase('write'):
+            # Only indexes and partitions over changed columns need maintenance,
+            # unless the row moves to a new key and every entry for it moves too
+            changed_columns = set(changes)
+            index_columns = [column for column in self.indexes.get(table_name, {})
+                             if rekey or column in changed_columns]
+            spec = schema.get('partition')
+            repartition = spec is not None and (rekey or spec['column'] in changed_columns)
+            
+            for column in index_columns:
+                self._remove_from_index(table_name, column, matches)
+            if repartition:
+                for record_id, record in matches:
+                    self._remove_from_partition(table_name, record_id, record)
+            elif spec is not None:
+                # Rows stay in their partitions, but those partition files change
+                for record_id, record in matches:
+                    self._mark_partition_dirty(table_name, self._partition_key(spec, record.get(spec['column'])))
+            
+            # Assign slots directly rather than through Row.__setitem__ for every row
+            slot_of = self._row_class(table_name)._slot_of
+            assignments = [(slot_of[column], value) for column, value in changes.items()]
+            for _, record in matches:
+                for slot, value in assignments:
+                    setattr(record, slot, value)
+            
+            removed_ids = ()
+            if rekey:
+                old_id, record = matches[0]
+                del table[old_id]
+                table[new_id] = record
+                record._seq = self._take_seq(table_name)
+                removed_ids = (old_id,)
+                matches = [(new_id, record)]
+            
+            for column in index_columns:
+                index = self.indexes[table_name][column]
+                for record_id, record in matches:
+                    index.setdefault(self._index_key(record.get(column)), set()).add(record_id)
+            if repartition:
+                for record_id, record in matches:
+                    self._assign_partition(table_name, record_id, record)
+            self._apply_view_deltas(table_name, removed_ids, matches, None if rekey else changed_columns)
+        
+        updated_count = len(matches)
+        self.profile.rows_returned += updated_count
+        self._bump_version(table_name)
+        self.save_data()
+        return True, f"Updated {updated_count} records in '{table_name}'"
     
     def delete(self, table_name, conditions=None):
+        """Remove every matching row, then drop them from indexes, partitions and views as a batch"""
         if not self.table_exists(table_name):
             return False, f"Table '{table_name}' does not exist"
         
-        deleted_count = 0
-        records_to_delete = []
+        success, conditions = self._coerce_conditions(table_name, conditions)
+        if not success:
+            return False, conditions
         
-        for record_id, record in self.data[table_name].items():
-            if not conditions or self._evaluate_conditions(record, conditions):
-                records_to_delete.append(record_id)
+        matches = self._find_matches(table_name, conditions)
+        if not matches:
+            return True, f"No records matched the conditions in '{table_name}'"
         
-        for record_id in records_to_delete:
-            del self.data[table_name][record_id]
-            deleted_count += 1
+        with self.profile.phase('write'):
+            self._remove_records(table_name, matches)
         
-        if deleted_count > 0:
-            self.save_data()
-            return True, f"Deleted {deleted_count} records from '{table_name}'"
+        deleted_count = len(matches)
+        self.profile.rows_returned += deleted_count
+        self._bump_version(table_name)
+        self.save_data()
+        return True, f"Deleted {deleted_count} records from '{table_name}'"
+    
+    def _remove_records(self, table_name, matches):
+        """Delete (record_id, record) pairs from a table and everything derived from it"""
+        table = self.data[table_name]
+        for column in self.indexes.get(table_name, {}):
+            self._remove_from_index(table_name, column, matches)
+        if 'partition' in self.schemas.get(table_name, {}):
+            for record_id, record in matches:
+                self._remove_from_partition(table_name, record_id, record)
+        
+        removed_ids = [record_id for record_id, _ in matches]
+        if len(removed_ids) == len(table):
+            table.clear()
         else:
-            return True, f"No records matched the conditions in '{table_name}'"
+            for record_id in removed_ids:
+                del table[record_id]
+        self._apply_view_deltas(table_name, removed_ids)
 
+    def _sort_records(self, table_name, records, order_by, limit=None):
+        """Sort records for ORDER BY, spilling to temp files if the sort would exceed memory_limit"""
+        column, direction = order_by
+        reverse = (direction.upper() == 'DESC')
+        
+        # Values are native, so compare them directly; NULLs sort as the largest
+        # value, after everything else ascending and first when descending
+        def sort_key(record):
+            value = record.get(column)
+            return (value is None, value)
+        
+        if self.memory_limit is not None:
+            entry_bytes = self._sort_entry_size(records, sort_key)
+            if entry_bytes * len(records) > self.memory_limit:
+                with self.profile.phase('spill'):
+                    return self._external_sort(table_name, records, sort_key, reverse, entry_bytes, limit)
+        
+        with self.profile.phase('sort'):
+            records.sort(key=sort_key, reverse=reverse)
+        return records
+    
+    @staticmethod
+    def _sort_entry_size(records, sort_key):
+        # A sort holds one key tuple per row, plus its slot in the list being sorted
+        def entry_size(record):
+            key = sort_key(record)
+            return sys.getsizeof(key) + _value_size(key[1]) + 8
+        return _sampled_size(iter(records), 1, entry_size) or 1
+    
+    def _external_sort(self, table_name, records, sort_key, reverse, entry_bytes, limit=None):
+        """Sort in memory_limit-sized runs spilled to temp files, then merge the runs lazily.
+        
+        Runs hold (sort key, primary key) pairs rather than rows, so the merged
+        order maps straight back to the stored rows.
+        """
+        table = self.data[table_name]
+        pk_column = self._primary_key_column(table_name)
+        run_rows = max(self.memory_limit // entry_bytes, -(-len(records) // SPILL_MAX_RUNS), 1)
+        
+        runs = []
+        for start in range(0, len(records), run_rows):
+            run = [(sort_key(record), record.get(pk_column)) for record in records[start:start + run_rows]]
+            run.sort(key=itemgetter(0), reverse=reverse)
+            if limit and limit > 0:
+                # No row past the first `limit` of a run can reach the merged result
+                del run[limit:]
+            f, size = _write_run(run)
+            self.profile.bytes_spilled += size
+            runs.append(_read_run(f))
+            del run
+        
+        merged = heapq.merge(*runs, key=itemgetter(0), reverse=reverse)
+        if limit and limit > 0:
+            merged = islice(merged, limit)
+        return [table[record_id] for _, record_id in merged]
+    
+    # Materialized View Operations
+    def create_view(self, view_name, table_name, query, conditions, order_by=None, limit=None):
+        """Create a materialized view over one table, kept current from write deltas"""
+        if view_name in self.views or self.table_exists(view_name):
+            return False, f"'{view_name}' already exists"
+        if not self.table_exists(table_name):
+            return False, f"Table '{table_name}' does not exist"
+        
+        success, coerced = self._coerce_conditions(table_name, conditions)
+        if not success:
+            return False, coerced
+        
+        self.views[view_name] = {
+            'table': table_name,
+            'query': query,
+            'conditions': [list(condition) for condition in conditions],
+            'order_by': list(order_by) if order_by else None,
+            'limit': limit
+        }
+        self._materialize_view(view_name)
+        self._bump_version(view_name)
+        self.save_data()
+        return True, f"Materialized view '{view_name}' created with {self._view_size(view_name)} records"
+    
+    def drop_view(self, view_name):
+        if view_name not in self.views:
+            return False, f"Materialized view '{view_name}' does not exist"
+        
+        del self.views[view_name]
+        self.view_rows.pop(view_name, None)
+        self._bump_version(view_name)
+        self.save_data()
+        return True, f"Materialized view '{view_name}' dropped"
+    
+    def select_view(self, view_name, conditions=None, order_by=None, limit=None):
+        """Read a materialized view; cost is proportional to the view's size, not its table's"""
+        if view_name not in self.views:
+            return None, f"Materialized view '{view_name}' does not exist"
+        
+        view = self.views[view_name]
+        table_name = view['table']
+        if view_name not in self.view_rows:
+            self._materialize_view(view_name)
+        
+        success, conditions = self._coerce_conditions(table_name, conditions)
+        if not success:
+            return None, conditions
+        
+        # The view's own ORDER BY/LIMIT define its rows; the statement's clauses apply to those
+        records_list = self._view_records(view_name)
+        if conditions:
+            records_list = [record for record in records_list if self._evaluate_conditions(record, conditions)]
+        if order_by:
+            records_list = self._sort_records(table_name, records_list, order_by, limit)
+        if limit and limit > 0:
+            records_list = records_list[:limit]
+        
+        self.profile.rows_returned += len(records_list)
+        return records_list, f"Found {len(records_list)} records in view '{view_name}'"
+    
+    def _view_records(self, view_name):
+        """Return a view's rows: its members in table order, then its own ORDER BY and LIMIT"""
+        view = self.views[view_name]
+        table_name = view['table']
+        with self.profile.phase('scan'):
+            table = self.data[table_name]
+            record_ids = self.view_rows[view_name]
+            self.profile.rows_scanned += len(record_ids)
+            records_list = [table[record_id] for record_id in record_ids]
+            # Rows updated into the view join out of table order; the sort is
+            # linear when they didn't
+            records_list.sort(key=attrgetter('_seq'))
+        
+        limit = view['limit']
+        if view['order_by']:
+            records_list = self._sort_records(table_name, records_list, view['order_by'], limit)
+        if limit and limit > 0:
+            records_list = records_list[:limit]
+        return records_list
+    
+    def _view_size(self, view_name):
+        size = len(self.view_rows[view_name])
+        limit = self.views[view_name]['limit']
+        return min(size, limit) if limit and limit > 0 else size
+    
+    def get_view_info(self, view_name):
+        view = self.views.get(view_name)
+        if view is None:
+            return None
+        
+        materialized = self.view_rows.get(view_name)
+        return {
+            'name': view_name,
+            'table': view['table'],
+            'query': view['query'],
+            'record_count': self._view_size(view_name) if materialized is not None else None
+        }
+    
+    def source_table(self, name):
+        """Return the table a name reads from: the base table for views, else the name itself"""
+        view = self.views.get(name)
+        return view['table'] if view else name
+    
+    def _materialize_view(self, view_name):
+        view = self.views[view_name]
+        _, conditions = self._coerce_conditions(view['table'], [tuple(c) for c in view['conditions']])
+        view['_compiled'] = conditions
+        # Members are a dict of record ids; reads put them in table order by row _seq
+        self.view_rows[view_name] = {record_id: None for record_id, record in self.data[view['table']].items()
+                                     if self._evaluate_conditions(record, conditions)}
+    
+    def _apply_view_delta(self, table_name, record_id, record):
+        """Add, keep or drop one row in every materialized view over table_name.
+        
+        record is the row's current contents, or None when the row was removed.
+        """
+        if record is None:
+            self._apply_view_deltas(table_name, removed_ids=(record_id,))
+        else:
+            self._apply_view_deltas(table_name, rows=((record_id, record),))
+    
+    def _apply_view_deltas(self, table_name, removed_ids=(), rows=(), changed_columns=None):
+        """Batched _apply_view_delta: drop removed_ids, then re-test (record_id, record) rows.
+        
+        When changed_columns is given, views whose filter reads none of them keep
+        their membership as is. Views that have not been materialized yet are
+        skipped; they are built from a full scan on first read.
+        """
+        for view_name, view in self.views.items():
+            if view['table'] != table_name or view_name not in self.view_rows:
+                continue
+            member_ids = self.view_rows[view_name]
+            for record_id in removed_ids:
+                member_ids.pop(record_id, None)
+            
+            conditions = view['_compiled']
+            if changed_columns is not None and not any(column in changed_columns for column, _, _ in conditions):
+                continue
+            for record_id, record in rows:
+                if self._evaluate_conditions(record, conditions):
+                    member_ids[record_id] = None
+                else:
+                    member_ids.pop(record_id, None)
+    
+    # Partition Operations
+    def drop_partition(self, table_name, partition_key):
+        """Drop every record in one partition without evaluating a predicate per row"""
+        if not self.table_exists(table_name):
+            return False, f"Table '{table_name}' does not exist"
+        
+        spec = self.schemas.get(table_name, {}).get('partition')
+        if not spec:
+            return False, f"Table '{table_name}' is not partitioned"
+        
+        entry = self.catalog.get(table_name, {})
+        if not self.is_loaded(table_name) and 'partitions' in entry:
+            # Each partition has its own file, so an unloaded table loses one
+            # partition by unlinking that file and updating the catalog
+            sizes = dict((key, size) for key, size in entry['partitions'])
+            if partition_key not in sizes:
+                return False, f"Partition '{partition_key}' does not exist in '{table_name}'"
+            
+            path = self._partition_path(table_name, partition_key)
+            if os.path.exists(path):
+                os.remove(path)
+            deleted_count = sizes[partition_key]
+            entry['partitions'] = [[key, size] for key, size in entry['partitions'] if key != partition_key]
+            entry['record_count'] = entry.get('record_count', 0) - deleted_count
+        else:
+            table = self.data[table_name]
+            record_ids = self.partitions[table_name].get(partition_key)
+            if record_ids is None:
+                return False, f"Partition '{partition_key}' does not exist in '{table_name}'"
+            
+            # Dropping the rows from memory marks only this partition dirty, so
+            # the save removes its file and leaves the other partitions alone
+            matches = [(record_id, table[record_id]) for record_id in record_ids]
+            self._remove_records(table_name, matches)
+            deleted_count = len(matches)
+        self._bump_version(table_name)
+        
+        self.save_data()
+        return True, f"Partition '{partition_key}' dropped from '{table_name}' ({deleted_count} records deleted)"
+    
+    def _partition_key(self, spec, value):
+        """Map a partition column value to the key of the partition holding it"""
+        if value is None:
+            return None
+        if spec['type'] == 'HASH':
+            # crc32 rather than hash() so keys are stable across processes
+            return zlib.crc32(str(value).encode()) % spec['partitions']
+        interval = spec['interval']
+        return int(float(value) // interval) * interval
+    
+    def _assign_partition(self, table_name, record_id, record):
+        spec = self.schemas.get(table_name, {}).get('partition')
+        if not spec:
+            return
+        key = self._partition_key(spec, record.get(spec['column']))
+        self.partitions[table_name].setdefault(key, set()).add(record_id)
+        self._mark_partition_dirty(table_name, key)
+    
+    def _remove_from_partition(self, table_name, record_id, record):
+        spec = self.schemas.get(table_name, {}).get('partition')
+        if not spec:
+            return
+        key = self._partition_key(spec, record.get(spec['column']))
+        record_ids = self.partitions[table_name].get(key)
+        if record_ids is not None:
+            record_ids.discard(record_id)
+            if not record_ids:
+                del self.partitions[table_name][key]
+        self._mark_partition_dirty(table_name, key)
+    
+    def _mark_partition_dirty(self, table_name, key):
+        # None means every partition of the table is rewritten on the next save
+        if self._dirty_partitions.get(table_name, ()) is not None:
+            self._dirty_partitions.setdefault(table_name, set()).add(key)
+    
+    def _rebuild_partitions(self, table_name):
+        spec = self.schemas[table_name]['partition']
+        partitions = self.partitions[table_name] = {}
+        for record_id, record in self.data.get(table_name, {}).items():
+            key = self._partition_key(spec, record.get(spec['column']))
+            partitions.setdefault(key, set()).add(record_id)
+    
+    def _prune_partitions(self, table_name, conditions):
+        """Return the partition keys that can hold rows matching conditions, or None for all"""
+        spec = self.schemas.get(table_name, {}).get('partition')
+        if not spec or not conditions:
+            return None
+        
+        column = spec['column']
+        keys = set(self.partitions[table_name])
+        pruned = False
+        
+        for condition_column, operator, value in conditions:
+            if condition_column != column:
+                continue
+            
+            if spec['type'] == 'HASH':
+                if operator == '=':
+                    keys &= {self._partition_key(spec, value)}
+                    pruned = True
+                continue
+            
+            try:
+                bound = float(value)
+            except ValueError:
+                continue
+            
+            interval = spec['interval']
+            if operator == '=':
+                keys &= {self._partition_key(spec, bound)}
+            elif operator in ['>', '>=']:
+                keys = {key for key in keys if key is not None and key + interval > bound}
+            elif operator in ['<', '<=']:
+                keys = {key for key in keys if key is not None and key <= bound}
+            else:
+                continue
+            pruned = True
+        
+        return keys if pruned else None
+    
+    def _find_matches(self, table_name, conditions):
+        """Return (record_id, record) pairs matching conditions"""
+        with self.profile.phase('scan'):
+            records = self._candidate_records(table_name, conditions)
+            self.profile.rows_scanned += len(records)
+            return [(record_id, record) for record_id, record in records.items()
+                    if not conditions or self._evaluate_conditions(record, conditions)]
+    
+    def _candidate_records(self, table_name, conditions):
+        """Return the records a query must scan, in table order, using an index or skipping pruned partitions"""
+        table = self.data[table_name]
+        record_ids = self._index_lookup(table_name, conditions)
+        if record_ids is not None:
+            self.profile.index_hits += 1
+            return self._in_table_order(table, (record_id for record_id in record_ids if record_id in table))
+        
+        keys = self._prune_partitions(table_name, conditions)
+        if keys is None:
+            return table
+        
+        partitions = self.partitions[table_name]
+        return self._in_table_order(table, (record_id for key in keys for record_id in partitions[key]))
+    
+    @staticmethod
+    def _in_table_order(table, record_ids):
+        # Index and partition sets are unordered (and TEXT hashes vary per process),
+        # so order candidates by position to keep results and LIMIT deterministic
+        candidates = [(record_id, table[record_id]) for record_id in record_ids]
+        candidates.sort(key=lambda item: item[1]._seq)
+        return dict(candidates)
+    
+    def _take_seq(self, table_name):
+        """Return the next table-order position for a row appended to table_name"""
+        seq = self.next_seq.get(table_name, 0)
+        self.next_seq[table_name] = seq + 1
+        return seq
+    
+    # Parallel Scan
+    def set_parallelism(self, workers):
+        """Set the number of worker processes used for full-table scans"""
+        if workers < 1:
+            return False, "Parallelism must be at least 1"
+        
+        if workers != self.parallelism:
+            self.shutdown_pool()
+        self.parallelism = workers
+        return True, f"Parallelism set to {workers}"
+    
+    def shutdown_pool(self):
+        """Stop the worker pool used for parallel scans and remove its column snapshots"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for table_name in list(self._snapshots):
+            self._drop_snapshot(table_name)
+    
+    def _parallel_scan(self, table_name, conditions):
+        """Filter a whole table by splitting its column snapshot across worker processes.
+        
+        Returns None when a filtered column can't be snapshotted, so the caller
+        scans serially instead.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.parallelism)
+        
+        try:
+            snapshot = self._snapshot(table_name)
+            row_class = self._row_class(table_name)
+            columns = self.schemas[table_name].get('columns', {})
+            layouts = {column: snapshot.column(row_class, column, columns[column].get('type', 'TEXT'))
+                       for column in dict.fromkeys(column for column, _, _ in conditions) if column in columns}
+        except (TypeError, OverflowError):
+            return None
+        
+        # Workers get file layouts and a row range, and send back only the
+        # positions of matching rows, so the merge step is a cheap lookup
+        rows = snapshot.rows
+        chunk_size = -(-len(rows) // self.parallelism)
+        futures = [self._pool.submit(_scan_columns, layouts, start, min(start + chunk_size, len(rows)), conditions)
+                   for start in range(0, len(rows), chunk_size)]
+        return [rows[i] for future in futures for i in future.result()]
+    
+    def _snapshot(self, table_name):
+        """Return the column snapshot for the table's current version, replacing a stale one"""
+        version = self.table_versions.get(table_name, 0)
+        snapshot = self._snapshots.get(table_name)
+        if snapshot is None or snapshot.version != version:
+            self._drop_snapshot(table_name)
+            if self._snapshot_dir is None:
+                self._snapshot_dir = tempfile.TemporaryDirectory(prefix='sql_engine_scan_')
+            snapshot = ColumnSnapshot(self._snapshot_dir.name, version, list(self.data[table_name].values()))
+            self._snapshots[table_name] = snapshot
+        return snapshot
+    
+    def _drop_snapshot(self, table_name):
+        snapshot = self._snapshots.pop(table_name, None)
+        if snapshot is not None:
+            snapshot.close()
+    
     # Schema Operations
     def describe_table(self, table_name):
         if not self.table_exists(table_name):
@@ -491,98 +2074,240 @@ class StorageEngine:
         if not self.table_exists(table_name):
             return False, f"Table '{table_name}' does not exist"
         
+        self.data[table_name]  # load the table, which also rebuilds its indexes
         if table_name not in self.indexes:
             self.indexes[table_name] = {}
         
         if column_name in self.indexes[table_name]:
             return False, f"Index on '{table_name}.{column_name}' already exists"
         
-        # Build index
+        self.indexes[table_name][column_name] = self._build_index(table_name, column_name)
+        self.save_data()
+        return True, f"Index created on '{table_name}.{column_name}'"
+    
+    def _build_index(self, table_name, column_name):
         index = {}
         for record_id, record in self.data[table_name].items():
-            value = record.get(column_name)
+            value = self._index_key(record.get(column_name))
             if value not in index:
-                index[value] = []
-            index[value].append(record_id)
-        
-        self.indexes[table_name][column_name] = index
-        self.save_data()
-        return True, f"Index created on '{table_name}.{column_name}'"
+                index[value] = set()
+            index[value].add(record_id)
+        return index
     
     # Helper Methods
-    def _validate_record(self, record, columns, table_name):
+    def _primary_key_column(self, table_name):
+        for col_name, col_info in self.schemas.get(table_name, {}).get('columns', {}).items():
+            if col_info.get('primary_key'):
+                return col_name
+        return None
+    
+    def get_table_version(self, table_name):
+        """Return a version that changes whenever what the name reads from changes.
+        
+        Views are versioned by their own name (bumped on create and drop) as
+        well as by their base table's contents.
+        """
+        source = self.source_table(table_name)
+        return self.table_versions.get(table_name, 0), self.table_versions.get(source, 0)
+    
+    def _bump_version(self, table_name):
+        # Versions are never reset, so a dropped and recreated table can't
+        # match results cached against its previous incarnation.
+        self.table_versions[table_name] = self.table_versions.get(table_name, 0) + 1
+        self._dirty.add(table_name)
+    
+    def _coerce_record(self, record, columns, table_name):
+        """Validate a record and convert every value to its column's native type"""
         for col_name, col_info in columns.items():
             if col_info.get('not_null') and col_name not in record:
                 return False, f"Required column '{col_name}' is missing"
         
+        coerced = {}
         for col_name, value in record.items():
             if col_name not in columns:
                 return False, f"Unknown column '{col_name}' in table '{table_name}'"
             
-            col_info = columns[col_name]
-            validation = self._validate_value(value, col_info, col_name)
-            if not validation[0]:
-                return validation
+            success, result = self._coerce_value(value, columns[col_name], col_name)
+            if not success:
+                return False, result
+            coerced[col_name] = result
         
-        return True, "Validation passed"
+        return True, coerced
     
-    def _validate_value(self, value, col_info, col_name):
-        data_type = col_info.get('type', 'TEXT')
+    @staticmethod
+    def _coerce_value(value, col_info, col_name, stored=False):
+        """Convert a value to the canonical type stored for its column.
+        
+        INT -> int, FLOAT -> float, BOOLEAN -> bool, DATE -> proleptic Gregorian
+        ordinal (int), DATETIME -> ISO 'YYYY-MM-DD HH:MM:SS' str, TEXT -> str.
+        NULL (None) is stored as-is. DATE ordinals are only accepted from stored
+        data (stored=True); user input must be a date or an ISO date string.
+        """
+        if value is None:
+            return True, None
         
+        data_type = col_info.get('type', 'TEXT')
         try:
             if data_type == 'INT':
-                int(value)
+                if isinstance(value, float) and not value.is_integer():
+                    raise ValueError(value)
+                return True, int(value)
             elif data_type == 'FLOAT':
-                float(value)
+                return True, float(value)
             elif data_type == 'BOOLEAN':
-                if str(value).upper() not in ['TRUE', 'FALSE', '1', '0']:
-                    return False, f"Column '{col_name}' must be BOOLEAN"
-        except (ValueError, TypeError):
+                if isinstance(value, bool):
+                    return True, value
+                text = str(value).upper()
+                if text in ['TRUE', '1']:
+                    return True, True
+                if text in ['FALSE', '0']:
+                    return True, False
+                return False, f"Column '{col_name}' must be BOOLEAN"
+            elif data_type == 'DATE':
+                if stored and isinstance(value, int) and not isinstance(value, bool):
+                    date.fromordinal(value)  # reject ordinals outside the supported range
+                    return True, value
+                if isinstance(value, datetime):
+                    raise ValueError(value)
+                if isinstance(value, date):
+                    return True, value.toordinal()
+                if not isinstance(value, str):
+                    raise TypeError(value)
+                return True, date.fromisoformat(value).toordinal()
+            elif data_type == 'DATETIME':
+                # Normalized ISO text sorts and compares in time order
+                if isinstance(value, datetime):
+                    return True, value.isoformat(sep=' ')
+                if isinstance(value, date):
+                    return True, datetime.combine(value, datetime.min.time()).isoformat(sep=' ')
+                if not isinstance(value, str):
+                    raise TypeError(value)
+                return True, datetime.fromisoformat(value).isoformat(sep=' ')
+            else:
+                return True, str(value)
+        except (ValueError, TypeError, OverflowError):
+            if data_type == 'DATE':
+                return False, f"Column '{col_name}' must be DATE (YYYY-MM-DD)"
+            if data_type == 'DATETIME':
+                return False, f"Column '{col_name}' must be DATETIME (YYYY-MM-DD[ HH:MM[:SS]])"
             return False, f"Column '{col_name}' must be {data_type}"
-        
-        return True, "Value valid"
     
-    def _evaluate_conditions(self, record, conditions):
-        for condition in conditions:
-            column, operator, value = condition
+    def _coerce_conditions(self, table_name, conditions):
+        """Convert WHERE literals to the native type of the column they compare against"""
+        if not conditions:
+            return True, conditions
+        
+        columns = self.schemas.get(table_name, {}).get('columns', {})
+        coerced = []
+        for column, operator, value in conditions:
+            if isinstance(value, str):
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in ['"', "'"]:
+                    value = value[1:-1]
+            if column in columns and operator != 'LIKE':
+                success, result = self._coerce_value(value, columns[column], column)
+                if not success and columns[column].get('type') == 'INT' and operator in ['>', '<', '>=', '<=']:
+                    # Range bounds on INT columns may be fractional, e.g. n > 5.5
+                    success, result = self._coerce_value(value, {'type': 'FLOAT'}, column)
+                value = result
+                if not success:
+                    return False, f"Invalid value in WHERE clause: {value}"
+            coerced.append((column, operator, value))
+        return True, coerced
+    
+    def result_rows(self, table_name, records):
+        """Snapshot records' values into a ResultRows that formats them for display on access"""
+        columns = self._row_class(table_name)._columns
+        schema_columns = self.schemas.get(table_name, {}).get('columns', {})
+        dates = [i for i, column in enumerate(columns) if schema_columns.get(column, {}).get('type') == 'DATE']
+        return ResultRows(columns, [record.as_tuple() for record in records], dates)
+    
+    def format_record(self, table_name, record):
+        """Return a copy of a record with native values converted for display"""
+        columns = self.schemas.get(table_name, {}).get('columns', {})
+        formatted = record.to_dict() if isinstance(record, Row) else dict(record)
+        for col_name, value in formatted.items():
+            if value is not None and columns.get(col_name, {}).get('type') == 'DATE':
+                try:
+                    formatted[col_name] = date.fromordinal(value).isoformat()
+                except (ValueError, TypeError, OverflowError):
+                    # Leave an unreadable value as-is rather than failing the whole query
+                    formatted[col_name] = value
+        return formatted
+    
+    @staticmethod
+    def _evaluate_conditions(record, conditions):
+        # Stored values and condition literals are both native, so compare directly;
+        # NULLs and values of the wrong type never satisfy an ordering comparison.
+        for column, operator, value in conditions:
             record_value = record.get(column)
             
             if operator == '=':
-                if str(record_value) != str(value):
+                if record_value != value:
                     return False
             elif operator == '!=':
-                if str(record_value) == str(value):
+                if record_value == value:
                     return False
-            elif operator == '>':
-                if not (float(record_value) > float(value)):
+            elif operator in ['>', '<', '>=', '<=']:
+                try:
+                    if operator == '>':
+                        matched = record_value > value
+                    elif operator == '<':
+                        matched = record_value < value
+                    elif operator == '>=':
+                        matched = record_value >= value
+                    else:
+                        matched = record_value <= value
+                except TypeError:
                     return False
-            elif operator == '<':
-                if not (float(record_value) < float(value)):
-                    return False
-            elif operator == '>=':
-                if not (float(record_value) >= float(value)):
-                    return False
-            elif operator == '<=':
-                if not (float(record_value) <= float(value)):
+                if not matched:
                     return False
         
         return True
     
+    @staticmethod
+    def _index_key(value):
+        # Values are stored in their native type, so they can key the index directly
+        return value
+    
+    def _index_lookup(self, table_name, conditions):
+        """Return candidate record ids for an equality condition on an indexed column, or None"""
+        indexes = self.indexes.get(table_name, {})
+        pk_column = self._primary_key_column(table_name)
+        for column, operator, value in conditions or []:
+            if operator == '=' and column == pk_column:
+                # Rows are keyed by their primary key, so the table is its own index
+                return [value]
+            if operator == '=' and column in indexes:
+                return indexes[column].get(self._index_key(value), ())
+        return None
+    
     def _update_indexes(self, table_name, record_id, record):
         if table_name in self.indexes:
             for column_name, index in self.indexes[table_name].items():
-                value = record.get(column_name)
+                value = self._index_key(record.get(column_name))
                 if value not in index:
-                    index[value] = []
-                if record_id not in index[value]:
-                    index[value].append(record_id)
+                    index[value] = set()
+                index[value].add(record_id)
+    
+    def _remove_from_index(self, table_name, column_name, matches):
+        """Drop (record_id, record) pairs from one index, keyed by the records' current values"""
+        index = self.indexes[table_name][column_name]
+        for record_id, record in matches:
+            value = self._index_key(record.get(column_name))
+            record_ids = index.get(value)
+            if record_ids is not None:
+                record_ids.discard(record_id)
+                if not record_ids:
+                    del index[value]
 
 class ProfessionalDatabase:
-    def __init__(self):
-        print("🚀 Starting Professional Database Engine...")
-        self.storage = StorageEngine()
+    def __init__(self, data_file="sql_engine.json"):
+        self.storage = StorageEngine(data_file)
         self.parser = SQLParser()
-        print("✅ Professional Database ready with duplicate table protection!")
+        self.query_cache = None
+        self.stats = QueryStats()
+        self.output_mode = 'grid'
     
     def execute(self, query):
         query = query.strip()
@@ -591,9 +2316,36 @@ class ProfessionalDatabase:
         
         print(f"📝 Executing: {original_query}")
         
+        profile = QueryProfile(original_query)
+        self.storage.profile = profile
+        start = time.perf_counter()
+        try:
+            result = self._dispatch(original_query, query_upper)
+        finally:
+            profile.total_seconds = time.perf_counter() - start
+            self.storage.profile = QueryProfile()
+        
+        if isinstance(result, dict) and 'error' in result:
+            profile.error = result['error']
+        self.stats.record(profile)
+        return result
+    
+    def add_query_hook(self, hook):
+        """Register a callable invoked with the QueryProfile of every executed statement"""
+        self.stats.hooks.append(hook)
+    
+    def remove_query_hook(self, hook):
+        if hook in self.stats.hooks:
+            self.stats.hooks.remove(hook)
+    
+    def _dispatch(self, original_query, query_upper):
         try:
             if query_upper.startswith("CREATE TABLE"):
                 return self._create_table(original_query)
+            elif query_upper.startswith("CREATE MATERIALIZED VIEW"):
+                return self._create_view(original_query)
+            elif query_upper.startswith("DROP MATERIALIZED VIEW"):
+                return self._drop_view(original_query)
             elif query_upper.startswith("DROP TABLE"):
                 return self._drop_table(original_query)
             elif query_upper.startswith("RENAME TABLE"):
@@ -610,10 +2362,25 @@ class ProfessionalDatabase:
                 return self._describe_table(original_query)
             elif query_upper == "SHOW TABLES":
                 return self._show_tables()
+            elif query_upper == "SHOW VIEWS":
+                return self._show_views()
+            elif query_upper == "SHOW CACHE":
+                return self._show_cache()
+            elif query_upper == "SHOW MEMORY":
+                return self._show_memory()
+            elif query_upper == "SHOW STATS":
+                return self._show_stats()
+            elif query_upper == "RESET STATS":
+                self.stats.reset()
+                return {"message": "✅ Query statistics reset"}
             elif query_upper.startswith("SHOW TABLE "):
                 return self._show_table_info(original_query)
             elif query_upper.startswith("CREATE INDEX"):
                 return self._create_index(original_query)
+            elif query_upper.startswith("ALTER TABLE"):
+                return self._alter_table(original_query)
+            elif query_upper.startswith("SET "):
+                return self._set_option(original_query)
             else:
                 return {"error": f"Unsupported SQL command"}
                 
@@ -676,13 +2443,48 @@ class ProfessionalDatabase:
         else:
             return {"error": f"❌ {message}"}
     
+    def _create_view(self, query):
+        view_name, select_query = self.parser.parse_create_view(query)
+        if not view_name:
+            return {"error": select_query}
+        
+        table_name, conditions, order_by, limit = self.parser.parse_select(select_query)
+        success, message = self.storage.create_view(view_name, table_name, select_query,
+                                                    conditions, order_by, limit)
+        if success:
+            return {"message": f"✅ {message}"}
+        else:
+            return {"error": f"❌ {message}"}
+    
+    def _drop_view(self, query):
+        view_match = re.search(r'DROP MATERIALIZED VIEW\s+(\w+)', query, re.IGNORECASE)
+        if not view_match:
+            return {"error": "Invalid syntax. Use: DROP MATERIALIZED VIEW view_name"}
+        
+        success, message = self.storage.drop_view(view_match.group(1))
+        if success:
+            return {"message": f"✅ {message}"}
+        else:
+            return {"error": f"❌ {message}"}
+    
+    def _show_views(self):
+        if not self.storage.views:
+            return {"message": "📭 No materialized views in database"}
+        
+        lines = ["👁️ Materialized views:"]
+        for view_name in sorted(self.storage.views):
+            info = self.storage.get_view_info(view_name)
+            count = info['record_count'] if info['record_count'] is not None else "not yet built"
+            lines.append(f"  • {view_name} ({count} records): {info['query']}")
+        return {"message": "\n".join(lines)}
+    
     def _show_table_info(self, query):
         table_match = re.search(r'SHOW TABLE\s+(\w+)', query, re.IGNORECASE)
         if not table_match:
             return {"error": "Invalid SHOW TABLE syntax. Use: SHOW TABLE table_name"}
         
         table_name = table_match.group(1)
-        table_info = self.storage.get_table_info(table_name)
+        table_info = self.storage.get_table_info(table_name, include_memory=True)
         
         if not table_info:
             return {"error": f"Table '{table_name}' does not exist"}
@@ -694,10 +2496,29 @@ class ProfessionalDatabase:
             f"🔑 Indexes: {', '.join(table_info['indexes']) if table_info['indexes'] else 'None'}"
         ]
         
+        memory = table_info['memory']
+        if memory:
+            parts = f"rows {format_bytes(memory['rows'])}, indexes {format_bytes(sum(memory['indexes'].values()))}"
+            if memory['partitions']:
+                parts += f", partitions {format_bytes(memory['partitions'])}"
+            info_lines.append(f"💾 Memory: ~{format_bytes(memory['total'])} ({parts})")
+        else:
+            info_lines.append("💾 Memory: not loaded")
+        
+        partition = table_info['partition']
+        if partition:
+            size = partition.get('partitions') or f"INTERVAL {partition['interval']}"
+            info_lines.append(f"🧩 Partitioned by {partition['type']}({partition['column']}) {size}")
+            is_date = table_info['columns'].get(partition['column'], {}).get('type') == 'DATE'
+            for key, count in table_info['partitions'].items():
+                label = date.fromordinal(key).isoformat() if is_date and key is not None else key
+                info_lines.append(f"   • {label}: {count} records")
+        
         return {"message": "\n".join(info_lines)}
     
     def _insert(self, query):
-        table_name, values = self.parser.parse_insert(query)
+        with self.storage.profile.phase('parse'):
+            table_name, values = self.parser.parse_insert(query)
         if not table_name:
             return {"error": values}
         
@@ -721,25 +2542,47 @@ class ProfessionalDatabase:
             return {"error": f"❌ {message}"}
     
     def _select(self, query):
-        result = self.parser.parse_select(query)
+        with self.storage.profile.phase('parse'):
+            result = self.parser.parse_select(query)
         if not result or not result[0]:
             return {"error": result[1] if result else "Invalid SELECT syntax"}
         
         table_name, conditions, order_by, limit = result
+        is_view = table_name in self.storage.views
         
         # Check if table exists
-        if not self.storage.table_exists(table_name):
+        if not is_view and not self.storage.table_exists(table_name):
             return {"error": f"❌ Table '{table_name}' does not exist"}
         
-        records, message = self.storage.select(table_name, conditions, order_by, limit)
+        if self.query_cache is not None:
+            cache_key = QueryCache.make_key(query)
+            version = self.storage.get_table_version(table_name)
+            cached = self.query_cache.get(cache_key, version)
+            if cached is not None:
+                records, message = cached
+                return {"result": records, "message": message, "columns": self._result_columns(table_name)}
+        
+        if is_view:
+            records, message = self.storage.select_view(table_name, conditions, order_by, limit)
+        else:
+            records, message = self.storage.select(table_name, conditions, order_by, limit)
         
         if records is None:
             return {"error": message}
-        else:
-            return {"result": records, "message": message}
+        
+        # Values are snapshotted now and formatted as the renderer consumes them
+        records = self.storage.result_rows(self.storage.source_table(table_name), records)
+        if self.query_cache is not None:
+            self.query_cache.put(cache_key, version, (records, message))
+        return {"result": records, "message": message, "columns": self._result_columns(table_name)}
+    
+    def _result_columns(self, table_name):
+        table_name = self.storage.source_table(table_name)
+        return list(self.storage.schemas.get(table_name, {}).get('columns', {}).keys())
     
     def _update(self, query):
-        result = self.parser.parse_update(query)
+        with self.storage.profile.phase('parse'):
+            result = self.parser.parse_update(query)
         if not result or not result[0]:
             return {"error": result[1] if result else "Invalid UPDATE syntax"}
         
@@ -757,7 +2600,8 @@ class ProfessionalDatabase:
             return {"error": f"❌ {message}"}
     
     def _delete(self, query):
-        result = self.parser.parse_delete(query)
+        with self.storage.profile.phase('parse'):
+            result = self.parser.parse_delete(query)
         if not result or not result[0]:
             return {"error": result[1] if result else "Invalid DELETE syntax"}
         
@@ -805,10 +2649,73 @@ class ProfessionalDatabase:
             column_count = len(table_info['columns']) if table_info and 'columns' in table_info else 0
             table_data.append([i+1, table_name, column_count, record_count])
         
+        from tabulate import tabulate
+        
         headers = ['#', 'TABLE NAME', 'COLUMNS', 'RECORDS']
         table = tabulate(table_data, headers, tablefmt='grid')
         return {"message": f"📊 Database Tables:\n{table}\nTotal: {len(tables)} tables"}
     
+    def _show_cache(self):
+        if self.query_cache is None:
+            return {"message": "📭 Query cache is OFF. Enable it with: SET query_cache = ON"}
+        
+        stats = self.query_cache.stats()
+        info_lines = [
+            "🗃️  Query Cache:",
+            f"📦 Entries: {stats['entries']} ({stats['bytes']} / {stats['max_bytes']} bytes)",
+            f"🎯 Hits: {stats['hits']}  Misses: {stats['misses']}  Hit rate: {stats['hit_rate']:.1%}",
+            f"♻️  Evictions: {stats['evictions']}  Invalidations: {stats['invalidations']}"
+        ]
+        return {"message": "\n".join(info_lines)}
+    
+    def _show_memory(self):
+        usage = self.storage.memory_usage()
+        limit = self.storage.memory_limit
+        
+        table_data = []
+        total = 0
+        for table_name, memory in sorted(usage['tables'].items()):
+            if memory is None:
+                table_data.append([table_name, 'table', 'not loaded'])
+                continue
+            table_data.append([table_name, 'table', format_bytes(memory['rows'])])
+            for column, size in memory['indexes'].items():
+                table_data.append([f"{table_name}.{column}", 'index', format_bytes(size)])
+            if memory['partitions']:
+                table_data.append([table_name, 'partitions', format_bytes(memory['partitions'])])
+            total += memory['total']
+        for view_name, size in sorted(usage['views'].items()):
+            table_data.append([view_name, 'view', format_bytes(size)])
+            total += size
+        if self.query_cache is not None:
+            table_data.append(['query cache', 'cache', format_bytes(self.query_cache.current_bytes)])
+            total += self.query_cache.current_bytes
+        
+        from tabulate import tabulate
+        
+        table = tabulate(table_data, ['NAME', 'KIND', 'APPROX. SIZE'], tablefmt='grid')
+        limit_text = format_bytes(limit) if limit is not None else 'none'
+        return {"message": f"🧠 Memory usage:\n{table}\nTotal: ~{format_bytes(total)}  Memory limit: {limit_text}"}
+    
+    def _show_stats(self):
+        stats = self.stats.summary()
+        statements = ', '.join(f"{name}: {count}" for name, count in sorted(stats['by_statement'].items()))
+        phases = ', '.join(f"{name} {ms:.1f} ms" for name, ms in sorted(stats['phases_ms'].items()))
+        
+        info_lines = [
+            "📈 Query Statistics:",
+            f"🧮 Queries: {stats['queries']} ({stats['errors']} errors) - {statements or 'none'}",
+            f"⏱️  Total: {stats['total_ms']:.1f} ms  Average: {stats['avg_ms']:.2f} ms",
+            f"🧩 Phases: {phases or 'none'}",
+            f"🔎 Rows scanned: {stats['rows_scanned']}  Rows returned: {stats['rows_returned']}  Index hits: {stats['index_hits']}",
+            f"💾 Bytes written: {stats['bytes_written']}  Spilled to temp files: {stats['bytes_spilled']}",
+            f"🐢 Slow queries (>= {stats['slow_query_ms']} ms): {len(stats['slow_queries'])}"
+        ]
+        for entry in stats['slow_queries'][-10:]:
+            info_lines.append(f"   • {entry['total_ms']:.1f} ms  {entry['query']}")
+        
+        return {"message": "\n".join(info_lines)}
+    
     def _create_index(self, query):
         index_match = re.search(r'CREATE INDEX ON\s+(\w+)\s*\((\w+)\)', query, re.IGNORECASE)
         if not index_match:
@@ -828,6 +2735,166 @@ class ProfessionalDatabase:
         else:
             return {"error": f"❌ {message}"}
 
+    def _alter_table(self, query):
+        drop_match = re.search(r'ALTER TABLE\s+(\w+)\s+DROP PARTITION\s+[\'"]?(\d{4}-\d{2}-\d{2}|-?\d+)[\'"]?',
+                               query, re.IGNORECASE)
+        if not drop_match:
+            return {"error": "Invalid ALTER TABLE syntax. Use: ALTER TABLE table_name DROP PARTITION key"}
+        
+        table_name = drop_match.group(1)
+        key_text = drop_match.group(2)
+        try:
+            # Partitions of DATE columns are keyed by the ordinal of their first day
+            partition_key = date.fromisoformat(key_text).toordinal() if '-' in key_text[1:] else int(key_text)
+        except ValueError:
+            return {"error": f"❌ Invalid partition key '{key_text}'"}
+        
+        success, message = self.storage.drop_partition(table_name, partition_key)
+        if success:
+            return {"message": f"✅ {message}"}
+        else:
+            return {"error": f"❌ {message}"}
+    
+    def _set_option(self, query):
+        set_match = re.search(r'SET\s+(\w+)\s*=\s*(\S+)', query, re.IGNORECASE)
+        if not set_match:
+            return {"error": "Invalid SET syntax. Use: SET option = value"}
+        
+        option = set_match.group(1).lower()
+        value = set_match.group(2)
+        
+        if option == 'parallelism':
+            if not value.isdigit():
+                return {"error": "❌ Parallelism must be a positive integer"}
+            success, message = self.storage.set_parallelism(int(value))
+        elif option == 'compression':
+            success, message = self.storage.set_compression(value.lower())
+        elif option == 'slow_query_ms':
+            if not value.isdigit():
+                return {"error": "❌ slow_query_ms must be a number of milliseconds"}
+            self.stats.slow_query_ms = int(value)
+            success, message = True, f"Slow query threshold set to {value} ms"
+        elif option == 'output':
+            if value.lower() not in OUTPUT_MODES:
+                return {"error": f"❌ output must be one of: {', '.join(OUTPUT_MODES)}"}
+            self.output_mode = value.lower()
+            success, message = True, f"Output mode set to {self.output_mode}"
+        elif option == 'query_cache':
+            if value.upper() not in ['ON', 'OFF']:
+                return {"error": "❌ query_cache must be ON or OFF"}
+            if value.upper() == 'ON':
+                if self.query_cache is None:
+                    self.query_cache = QueryCache()
+            else:
+                self.query_cache = None
+            success, message = True, f"Query cache {value.upper()}"
+        elif option == 'query_cache_size':
+            if not value.isdigit():
+                return {"error": "❌ query_cache_size must be a number of bytes"}
+            if self.query_cache is None:
+                self.query_cache = QueryCache(int(value))
+            else:
+                self.query_cache.resize(int(value))
+            success, message = True, f"Query cache size set to {value} bytes"
+        elif option == 'memory_limit':
+            if not value.isdigit():
+                return {"error": "❌ memory_limit must be a number of bytes (0 for no limit)"}
+            success, message = self.storage.set_memory_limit(int(value))
+        else:
+            return {"error": f"❌ Unknown option '{option}'"}
+        
+        if success:
+            return {"message": f"✅ {message}"}
+        else:
+            return {"error": f"❌ {message}"}
+
+def format_bytes(size):
+    """Format a byte count with a binary unit, e.g. 1536 -> '1.5 KB'"""
+    for unit in ['B', 'KB', 'MB']:
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+def print_database_result(result, out=None, mode='grid'):
+    """Write a result to out, streaming row results instead of building one big string"""
+    out = out or sys.stdout
+    if result and 'error' not in result and 'result' in result:
+        rows = iter(result['result'])
+        message = result.get('message', 'Query executed successfully')
+        first = next(rows, None)
+        if first is None:
+            out.write(f"📭 {message}\n")
+            return
+        if mode == 'grid':
+            out.write(f"📊 {message}:\n")
+        render_rows(chain([first], rows), result.get('columns'), out, mode)
+    else:
+        out.write(format_database_result(result) + "\n")
+
+def render_rows(rows, columns, out, mode='grid'):
+    """Write rows (an iterable of dicts, e.g. a cursor) to out in the given output mode.
+    
+    Rows are consumed one at a time. In grid mode column widths come from the
+    headers and the first RENDER_SAMPLE_ROWS rows; later cells that don't fit
+    are truncated rather than re-measuring the whole result.
+    """
+    rows = iter(rows)
+    if columns is None:
+        # Without a schema, take headers from the first row
+        first = next(rows, None)
+        if first is None:
+            return
+        columns = list(first.keys())
+        rows = chain([first], rows)
+    
+    if mode == 'csv':
+        writer = csv.writer(out)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(['' if row.get(c) is None else row.get(c) for c in columns])
+    elif mode == 'jsonl':
+        for row in rows:
+            out.write(json.dumps({c: row.get(c) for c in columns}, default=str) + "\n")
+    elif mode == 'raw':
+        for row in rows:
+            out.write(repr(tuple(row.get(c) for c in columns)) + "\n")
+    else:
+        _render_grid(rows, columns, out)
+
+def _render_grid(rows, columns, out):
+    sample = list(islice(rows, RENDER_SAMPLE_ROWS))
+    widths = [len(str(c)) for c in columns]
+    numeric = [True] * len(columns)
+    for row in sample:
+        for i, column in enumerate(columns):
+            value = row.get(column)
+            widths[i] = max(widths[i], len(_cell_text(value)))
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                numeric[i] = False
+    widths = [min(width, MAX_COLUMN_WIDTH) for width in widths]
+    
+    border = '+' + '+'.join('-' * (width + 2) for width in widths) + '+\n'
+    header_border = '+' + '+'.join('=' * (width + 2) for width in widths) + '+\n'
+    
+    def line(cells):
+        parts = []
+        for text, width, align_right in zip(cells, widths, numeric):
+            if len(text) > width:
+                text = text[:width - 1] + '…'
+            parts.append(text.rjust(width) if align_right else text.ljust(width))
+        return '| ' + ' | '.join(parts) + ' |\n'
+    
+    out.write(border)
+    out.write(line([str(c) for c in columns]))
+    out.write(header_border)
+    for row in chain(sample, rows):
+        out.write(line([_cell_text(row.get(c)) for c in columns]))
+        out.write(border)
+
+def _cell_text(value):
+    return 'NULL' if value is None else str(value)
+
 def format_database_result(result):
     """Format database results professionally"""
     if not result:
@@ -836,8 +2903,17 @@ def format_database_result(result):
     if 'error' in result:
         return result['error']
     
-    if 'message' in result:
-        return result['message']
+    if 'result' in result:
+        data = iter(result['result'])
+        message = result.get('message', 'Query executed successfully')
+        
+        first = next(data, None)
+        if first is None:
+            return f"📭 {message}"
+        
+        buffer = io.StringIO()
+        render_rows(chain([first], data), result.get('columns'), buffer)
+        return f"📊 {message}:\n{buffer.getvalue().rstrip()}"
     
     if 'schema' in result:
         schema = result['schema']
@@ -846,6 +2922,8 @@ def format_database_result(result):
         if not columns:
             return "📭 No columns defined"
         
+        from tabulate import tabulate
+        
         table_data = []
         for col_name, col_info in columns.items():
             constraints = []
@@ -868,19 +2946,8 @@ def format_database_result(result):
         table = tabulate(table_data, headers, tablefmt='grid')
         return f"📋 Table Schema:\n{table}"
     
-    if 'result' in result:
-        data = result['result']
-        message = result.get('message', 'Query executed successfully')
-        
-        if not data:
-            return f"📭 {message}"
-        
-        if isinstance(data, list) and data:
-            # Get all keys from first record for headers
-            headers = list(data[0].keys())
-            table_data = [[record.get(h, 'NULL') for h in headers] for record in data]
-            table = tabulate(table_data, headers, tablefmt='grid')
-            return f"📊 {message}:\n{table}"
+    if 'message' in result:
+        return result['message']
     
     return "❓ Unexpected result format"
 
@@ -891,11 +2958,16 @@ def main():
     except ImportError:
         print("📦 Installing tabulate library...")
         import subprocess
-        import sys
         subprocess.check_call([sys.executable, "-m", "pip", "install", "tabulate"])
         print("✅ Tabulate installed successfully!")
     
+    print("🚀 Starting Professional Database Engine...")
     db = ProfessionalDatabase()
+    if os.path.exists(db.storage.data_file):
+        print(f"✓ Database loaded with {len(db.storage.schemas)} tables")
+    else:
+        print("✓ New database created")
+    print("✅ Professional Database ready with duplicate table protection!")
     
     print("=" * 80)
     print("🎪 PROFESSIONAL DATABASE - DUPLICATE TABLE PROTECTION")
@@ -932,8 +3004,11 @@ def main():
                 continue
             
             result = db.execute(command)
-            formatted = format_database_result(result)
-            print(f"\n{formatted}")
+            print()
+            if result and 'result' in result:
+                print_database_result(result, sys.stdout, db.output_mode)
+            else:
+                print(format_database_result(result))
             
         except KeyboardInterrupt:
             print("\n\n👋 Thank you for using Professional Database!")
@@ -953,6 +3028,26 @@ def print_help():
     print("  SHOW TABLES                 - List all tables")
     print("  SHOW TABLE table            - Show table details")
     print("  DESC table                  - Show table schema")
+    print("\n🧩 PARTITIONING:")
+    print("  CREATE TABLE t (...) PARTITION BY HASH(col) PARTITIONS n")
+    print("  CREATE TABLE t (...) PARTITION BY RANGE(col) INTERVAL n")
+    print("  ALTER TABLE t DROP PARTITION key - Drop a whole partition")
+    print("\n👁️  MATERIALIZED VIEWS:")
+    print("  CREATE MATERIALIZED VIEW v AS SELECT ... - Keep a query's rows up to date")
+    print("  DROP MATERIALIZED VIEW v    - Delete a view")
+    print("  SHOW VIEWS                  - List views")
+    print("\n⚙️  SETTINGS:")
+    print("  SET parallelism = N         - Scan large tables with N processes")
+    print("  SET compression = zlib|lzma|none - Compression for table files")
+    print("  SET query_cache = ON|OFF    - Cache SELECT results until tables change")
+    print("  SET query_cache_size = N    - Limit the result cache to N bytes")
+    print("  SHOW CACHE                  - Show result cache hit/miss stats")
+    print("  SHOW MEMORY                 - Show approximate memory used by tables, indexes and caches")
+    print("  SET memory_limit = N        - Spill sorts larger than N bytes to temp files (0 = no limit)")
+    print("  SET output = grid|csv|jsonl|raw - How SELECT results are printed")
+    print("  SET slow_query_ms = N       - Log queries slower than N ms")
+    print("  SHOW STATS                  - Show query timings and counters")
+    print("  RESET STATS                 - Clear query statistics")
     print("\n💡 DUPLICATE PROTECTION:")
     print("  • CREATE TABLE fails if table exists")
     print("  • Clear error messages with suggestions")